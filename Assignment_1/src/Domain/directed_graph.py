@@ -1,5 +1,7 @@
 # This module contains the representation of the class DirectedGraph
 # Imports Section
+from array import array
+from itertools import repeat
 from .edge import Edge
 from .vertex import Vertex
 
@@ -126,9 +128,10 @@ class DirectedGraphInboundIterator:
 
 # DIRECTEDGRAPH CLASS IMPLEMENTATION
 # Internal Representation Specifications:
-# We keep 3 dictionaries for efficiency in getting the inbound, outbound edges of a vertex, or cost of an edge
-# The inbound/outbound edges dictionary takes as keys the vertices and as values a list of the inbound/outbound edges
-# The costs dictionary takes as keys the edges and as values the costs
+# We keep 2 dictionaries for efficiency in getting the inbound, outbound edges of a vertex, or cost of an edge
+# The inbound/outbound dictionaries take as keys the vertex ID numbers and as values the adjacency of that vertex
+# An adjacency is an insertion-ordered dictionary from the neighbour ID number to the cost of the edge ( None if no cost )
+# so that finding an edge or its cost is O(1), while the edges are still seen in the order they were added
 
 class DirectedGraph:
 
@@ -142,13 +145,16 @@ class DirectedGraph:
         self.__vertices = 0
         self.__edges = 0
 
-        # Inbound / Outbound Neighbours are initially empty
+        # Number of edges having a negative cost is initially zero
+        self.__negative_edges = 0
+
+        # Last Frozen snapshot, kept until the next modification ( None if there is none )
+        self.__frozen = None
+
+        # Inbound / Outbound Neighbours ( and the Costs of the Edges ) are initially empty
         self.__inbound = {}
         self.__outbound = {}
 
-        # Costs of the Edges of the Graphs is initially empty
-        self.__costs = {}
-
     # CLASS DIRECTEDGRAPH GENERAL STATISTICS
     def vertices_count(self):
         """
@@ -162,6 +168,13 @@ class DirectedGraph:
         """
         return self.__edges
 
+    def has_negative_costs(self):
+        """
+        Returns True if at least one edge of the Directed Graph has a negative cost, False otherwise
+        ( Kept up to date by every modification, so it is O(1) )
+        """
+        return self.__negative_edges > 0
+
     # CLASS DIRECTEDGRAPH PARTICULAR STATISTICS
     def degree(self, vertex: int):
         """
@@ -169,19 +182,10 @@ class DirectedGraph:
         If the Vertex is not inside the Graph, returns None
         :param vertex: Vertex to Search
         """
-        vertex = self.find_vertex(vertex)
-        if not vertex:
+        if vertex not in self.__outbound:
             return None
 
-        inbound = 0
-        outbound = 0
-
-        if vertex in self.__inbound.keys():
-            inbound = len(self.__inbound[vertex])
-        if vertex in self.__outbound.keys():
-            outbound = len(self.__outbound[vertex])
-
-        return inbound, outbound
+        return len(self.__inbound[vertex]), len(self.__outbound[vertex])
 
     # CLASS DIRECTEDGRAPH STRUCTURE GETTERS
     def find_vertex(self, number: int):
@@ -189,10 +193,8 @@ class DirectedGraph:
         Returns the vertex with the specified numberID if found, None otherwise
         :param number: Source Vertex
         """
-        vertex = Vertex(number)
-
-        if vertex in self.__inbound.keys():
-            return vertex
+        if number in self.__outbound:
+            return Vertex(number)
         return None
 
     def find_edge(self, source: int, target: int):
@@ -201,27 +203,17 @@ class DirectedGraph:
         :param source: Source Vertex
         :param target: Target Vertex
         """
-        source = self.find_vertex(source)
-        target = self.find_vertex(target)
-        edge = Edge(source, target)
-
-        if (not source) or (not target):
+        adjacency = self.__outbound.get(source)
+        if adjacency is None or target not in adjacency:
             return None
 
-        if edge in self.__outbound[source]:
-            return edge
-        return None
+        return Edge(Vertex(source), Vertex(target))
 
     def vertices(self):
         """
         Returns all the vertices inside the Directed Graph
         """
-
-        vertices_list = []
-        for vertex in self.__inbound.keys():
-            vertices_list.append(vertex)
-
-        return vertices_list.copy()
+        return [Vertex(number) for number in self.__outbound.keys()]
 
     def inbound_edges(self, vertex: int):
         """
@@ -230,12 +222,11 @@ class DirectedGraph:
 
         :param vertex: The ID number of the Vertex to analyze
         """
-
-        vertex = self.find_vertex(vertex)
-        if not vertex:
+        if vertex not in self.__inbound:
             return None
 
-        return self.__inbound[vertex].copy()
+        target = Vertex(vertex)
+        return [Edge(Vertex(source), target) for source in self.__inbound[vertex]]
 
     def outbound_edges(self, vertex: int):
         """
@@ -244,12 +235,47 @@ class DirectedGraph:
 
         :param vertex: The ID number of the Vertex to analyze
         """
+        if vertex not in self.__outbound:
+            return None
+
+        source = Vertex(vertex)
+        return [Edge(source, Vertex(target)) for target in self.__outbound[vertex]]
+
+    def inbound_neighbours(self, vertex: int):
+        """
+        Returns an iterator over the ID numbers of the sources of the inbound edges of a specified vertex
+        ( Read straight from the adjacency, without copying it; the graph must not change while it is used )
+        If the vertex is not inside the Graph, return None
+
+        :param vertex: The ID number of the Vertex to analyze
+        """
+        if vertex not in self.__inbound:
+            return None
+
+        return iter(self.__inbound[vertex])
+
+    def outbound_neighbours(self, vertex: int):
+        """
+        Returns an iterator over the ID numbers of the targets of the outbound edges of a specified vertex
+        ( Read straight from the adjacency, without copying it; the graph must not change while it is used )
+        If the vertex is not inside the Graph, return None
 
-        vertex = self.find_vertex(vertex)
-        if not vertex:
+        :param vertex: The ID number of the Vertex to analyze
+        """
+        if vertex not in self.__outbound:
             return None
 
-        return self.__outbound[vertex].copy()
+        return iter(self.__outbound[vertex])
+
+    def weighted_edges(self):
+        """
+        Yields every edge of the Directed Graph as a (source, target, cost) tuple of ID numbers and cost
+        ( cost is None for edges without a cost ), grouped by source in the order of vertices()
+        The edges are read straight from the adjacency, without copying it or creating Vertex / Edge objects
+        """
+        for (source, adjacency) in self.__outbound.items():
+            for (target, cost) in adjacency.items():
+                yield source, target, cost
 
     # CLASS DIRECTEDGRAPH STRUCTURE ITERATORS
     def vertex_iterator(self):
@@ -288,14 +314,11 @@ class DirectedGraph:
         :param source: Source Vertex
         :param target: Target Vertex
         """
-
-        edge = self.find_edge(source, target)
-        if not edge:
-            return None
-        if edge not in self.__costs.keys():
+        adjacency = self.__outbound.get(source)
+        if adjacency is None:
             return None
 
-        return self.__costs[edge]
+        return adjacency.get(target)
 
     def modify_cost(self, source: int, target: int, cost: int):
         """
@@ -306,15 +329,27 @@ class DirectedGraph:
         :param target: Target Vertex
         :param cost: New Edge Cost
         """
-
-        edge = self.find_edge(source, target)
-        if not edge:
+        adjacency = self.__outbound.get(source)
+        if adjacency is None or target not in adjacency:
             return None
 
-        self.__costs[edge] = cost
+        self.__frozen = None
+        self.__count_negative(adjacency[target], cost)
+        adjacency[target] = cost
+        self.__inbound[target][source] = cost
 
         return cost
 
+    def __count_negative(self, old_cost, new_cost):
+        """
+        Updates the number of negative cost edges when the cost of an edge changes from old_cost to new_cost
+        ( None stands for a missing edge or a missing cost )
+        """
+        if old_cost is not None and old_cost < 0:
+            self.__negative_edges -= 1
+        if new_cost is not None and new_cost < 0:
+            self.__negative_edges += 1
+
     # CLASS STRUCTURE MODIFICATION METHODS
     # Add / Remove Vertices and Edges
     def add_vertex(self, vertex_number: int):
@@ -324,16 +359,15 @@ class DirectedGraph:
 
         :param vertex_number: The ID number of the Vertex
         """
-        vertex = self.find_vertex(vertex_number)
-        if vertex:
+        if vertex_number in self.__outbound:
             return None
 
-        vertex = Vertex(vertex_number)
+        self.__frozen = None
         self.__vertices += 1
-        self.__inbound[vertex] = []
-        self.__outbound[vertex] = []
+        self.__inbound[vertex_number] = {}
+        self.__outbound[vertex_number] = {}
 
-        return vertex
+        return Vertex(vertex_number)
 
     def remove_vertex(self, vertex_number: int):
         """
@@ -347,20 +381,20 @@ class DirectedGraph:
 
         # If vertex inside the graph, remove it
         # Otherwise return None
-        vertex = self.find_vertex(vertex_number)
-        if not vertex:
+        if vertex_number not in self.__outbound:
             return None
 
+        self.__frozen = None
         self.__vertices -= 1
-        for edge in self.__inbound[vertex]:
-            self.remove_edge(edge.source.number, edge.target.number)
-        for edge in self.__outbound[vertex]:
-            self.remove_edge(edge.source.number, edge.target.number)
+        for source in list(self.__inbound[vertex_number]):
+            self.remove_edge(source, vertex_number)
+        for target in list(self.__outbound[vertex_number]):
+            self.remove_edge(vertex_number, target)
 
-        del self.__inbound[vertex]
-        del self.__outbound[vertex]
+        del self.__inbound[vertex_number]
+        del self.__outbound[vertex_number]
 
-        return vertex
+        return Vertex(vertex_number)
 
     def add_edge(self, source: int, target: int):
         """
@@ -370,23 +404,78 @@ class DirectedGraph:
         :param source: Source Vertex
         :param target: Target Vertex
         """
-        source = Vertex(source)
-        target = Vertex(target)
-        edge = Edge(source, target)
-
-        if self.find_edge(source.number, target.number):
+        if self.find_edge(source, target):
             return None
 
-        self.__edges += 1
         if target not in self.__inbound:
-            self.add_vertex(target.number)
-        self.__inbound[target].append(edge)
-
+            self.add_vertex(target)
         if source not in self.__outbound:
-            self.add_vertex(source.number)
-        self.__outbound[source].append(edge)
+            self.add_vertex(source)
+
+        self.__frozen = None
+        self.__edges += 1
+        self.__inbound[target][source] = None
+        self.__outbound[source][target] = None
+
+        return Edge(Vertex(source), Vertex(target))
+
+    # CLASS BULK MODIFICATION METHODS
+    # Add many Edges ( and their Costs ) in a single pass
+    def add_edges_from(self, edges, targets=None, costs=None):
+        """
+        Adds many Edges to the Directed Graph in one pass and returns the number of newly added edges
+        If either the source or target vertices not in the graph, add them
+        Duplicate edges are only added once, the last given cost is the one kept
 
-        return edge
+        :param edges: Iterable of (source, target) tuples, or the array of sources if targets is given
+        :param targets: Optional array of targets, parallel to the array of sources
+        :param costs: Optional array of costs, parallel to the edges ( existing costs are kept if missing )
+        """
+        if costs is None:
+            costs = repeat(None)
+        if targets is not None:
+            return self.__add_weighted_edges(zip(edges, targets, costs))
+
+        return self.__add_weighted_edges((source, target, cost) for ((source, target), cost) in zip(edges, costs))
+
+    def add_weighted_edges_from(self, edges):
+        """
+        Adds many Edges with their Costs to the Directed Graph in one pass and returns the number of newly added edges
+        If either the source or target vertices not in the graph, add them
+        Duplicate edges are only added once, the last given cost is the one kept
+
+        :param edges: Iterable of (source, target, cost) tuples
+        """
+        return self.__add_weighted_edges(edges)
+
+    def __add_weighted_edges(self, edges):
+        """
+        Adds (source, target, cost) Edges directly into the adjacency dictionaries and returns the number of new edges
+        A cost of None leaves the cost of an already existing edge unchanged
+        """
+        inbound = self.__inbound
+        outbound = self.__outbound
+        added = 0
+
+        for (source, target, cost) in edges:
+            if target not in outbound:
+                self.add_vertex(target)
+            adjacency = outbound.get(source)
+            if adjacency is None:
+                self.add_vertex(source)
+                adjacency = outbound[source]
+
+            if target not in adjacency:
+                added += 1
+            elif cost is None:
+                continue
+            self.__frozen = None
+            self.__count_negative(adjacency.get(target), cost)
+            adjacency[target] = cost
+            inbound[target][source] = cost
+
+        self.__edges += added
+        return added
 
     def remove_edge(self, source: int, target: int):
         """
@@ -399,16 +488,16 @@ class DirectedGraph:
 
         # If edge inside the graph, remove it
         # Otherwise return None
-        edge = self.find_edge(source, target)
-
-        if not edge:
+        if not self.find_edge(source, target):
             return None
 
+        self.__frozen = None
         self.__edges -= 1
-        self.__inbound[Vertex(target)].remove(edge)
-        self.__outbound[Vertex(source)].remove(edge)
+        self.__count_negative(self.__outbound[source][target], None)
+        del self.__inbound[target][source]
+        del self.__outbound[source][target]
 
-        return edge.source, edge.target
+        return Vertex(source), Vertex(target)
 
     # CLASS COPY CREATION METHOD
     def copy(self):
@@ -420,14 +509,426 @@ class DirectedGraph:
         # Graph Structure
         graph_copy = DirectedGraph()
 
-        # Copying all vertices and edges
-        for edge in self.__inbound.values():
-            graph_copy.add_edge(edge.source.number, edge.target.number)
-        for edge in self.__outbound.values():
-            graph_copy.add_edge(edge.source.number, edge.target.number)
-
-        # Copying all costs
-        for (edge, cost) in self.__costs:
-            graph_copy.modify_cost(edge.source.number, edge.target.number, cost)
+        # Copying all vertices, then all edges and their costs
+        for vertex in self.__outbound.keys():
+            graph_copy.add_vertex(vertex)
+        for (source, adjacency) in self.__outbound.items():
+            for (target, cost) in adjacency.items():
+                graph_copy.add_edge(source, target)
+                graph_copy.modify_cost(source, target, cost)
 
         return graph_copy
+
+    # CLASS FROZEN SNAPSHOT CREATION METHOD
+    def freeze(self):
+        """
+        Returns an immutable CSR ( compressed sparse row ) snapshot of the current state of the DirectedGraph
+        ( Vertices get dense ids 0...n-1 in the order of vertices(), edges are stored in contiguous arrays )
+        The snapshot is kept and given back until the next modification, so repeated queries build it only once
+        """
+        if self.__frozen is None:
+            self.__frozen = self.__build_frozen()
+        return self.__frozen
+
+    def __build_frozen(self):
+        """
+        Builds the CSR snapshot returned by freeze()
+        """
+
+        # Dense ids of the vertices
+        vertex_numbers = list(self.__outbound.keys())
+        index = {number: dense_id for (dense_id, number) in enumerate(vertex_numbers)}
+
+        # Edges without an associated cost, as (source id, target id) pairs
+        uncosted = set()
+
+        # Outbound rows, in the order of outbound_edges()
+        out_offsets = array('q', [0])
+        out_targets = array('q')
+        out_costs = array('q')
+        for (source, adjacency) in self.__outbound.items():
+            for (target, cost) in adjacency.items():
+                if cost is None:
+                    uncosted.add((index[source], index[target]))
+                    cost = 0
+                out_targets.append(index[target])
+                out_costs.append(cost)
+            out_offsets.append(len(out_targets))
+
+        # Inbound rows ( the transposed graph ), in the order of inbound_edges()
+        in_offsets = array('q', [0])
+        in_sources = array('q')
+        in_costs = array('q')
+        for target in vertex_numbers:
+            for (source, cost) in self.__inbound[target].items():
+                in_sources.append(index[source])
+                in_costs.append(0 if cost is None else cost)
+            in_offsets.append(len(in_sources))
+
+        return FrozenDirectedGraph(vertex_numbers, out_offsets, out_targets, out_costs,
+                                   in_offsets, in_sources, in_costs, uncosted)
+
+
+# FROZENDIRECTEDGRAPH CLASS IMPLEMENTATION
+# Internal Representation Specifications:
+# Vertices are mapped to dense ids 0...n-1, and the edges are kept in CSR ( compressed sparse row ) form
+# The outbound edges of the vertex with id i are out_targets[out_offsets[i]:out_offsets[i+1]], with out_costs alongside
+# The inbound edges are kept the same way ( in_offsets, in_sources, in_costs ), as a transposed copy of the graph
+# The snapshot is read-only: it offers the getters / iterators of the DirectedGraph, but no modification methods
+
+class FrozenDirectedGraph:
+
+    # CLASS INITIALIZATION
+    def __init__(self, vertex_numbers, out_offsets, out_targets, out_costs, in_offsets, in_sources, in_costs, uncosted):
+        """
+        Initializes a new FrozenDirectedGraph Object from already built CSR arrays
+        ( Use DirectedGraph.freeze() or io_file_services.load_graph_binary() to get one )
+        """
+        self.__numbers = vertex_numbers
+        self.__index = {number: dense_id for (dense_id, number) in enumerate(vertex_numbers)}
+
+        self.__out_offsets = out_offsets
+        self.__out_targets = out_targets
+        self.__out_costs = out_costs
+
+        self.__in_offsets = in_offsets
+        self.__in_sources = in_sources
+        self.__in_costs = in_costs
+
+        self.__uncosted = frozenset(uncosted)
+        self.__negative_costs = None
+        self.__order = None
+        self.__sorted = False
+
+    # CLASS CSR PROPERTIES
+    @property
+    def vertex_numbers(self):
+        """
+        :return: The list of the vertex ID numbers, indexed by dense id
+        """
+        return self.__numbers
+
+    @property
+    def out_offsets(self):
+        """
+        :return: The offsets array of the outbound rows ( length vertices_count() + 1 )
+        """
+        return self.__out_offsets
+
+    @property
+    def out_targets(self):
+        """
+        :return: The dense ids of the targets of the outbound edges
+        """
+        return self.__out_targets
+
+    @property
+    def out_costs(self):
+        """
+        :return: The costs of the outbound edges ( 0 for edges without a cost )
+        """
+        return self.__out_costs
+
+    @property
+    def in_offsets(self):
+        """
+        :return: The offsets array of the inbound rows ( length vertices_count() + 1 )
+        """
+        return self.__in_offsets
+
+    @property
+    def in_sources(self):
+        """
+        :return: The dense ids of the sources of the inbound edges
+        """
+        return self.__in_sources
+
+    @property
+    def in_costs(self):
+        """
+        :return: The costs of the inbound edges ( 0 for edges without a cost )
+        """
+        return self.__in_costs
+
+    @property
+    def uncosted_edges(self):
+        """
+        :return: The set of (source id, target id) pairs of the edges without an associated cost
+        """
+        return self.__uncosted
+
+    def index_of(self, number: int):
+        """
+        Returns the dense id of the vertex with the specified numberID if found, None otherwise
+        :param number: The ID number of the Vertex
+        """
+        return self.__index.get(number)
+
+    # CLASS FROZENDIRECTEDGRAPH PICKLING
+    def __reduce__(self):
+        """
+        Pickles the Frozen Directed Graph with its CSR arrays copied into array('q') ( the memoryviews over the file
+        pages of a graph given by load_graph_binary() cannot be pickled ), e.g. to send it to a worker process
+        """
+        return FrozenDirectedGraph, (list(self.__numbers), array('q', self.__out_offsets),
+                                     array('q', self.__out_targets), array('q', self.__out_costs),
+                                     array('q', self.__in_offsets), array('q', self.__in_sources),
+                                     array('q', self.__in_costs), self.__uncosted)
+
+    # CLASS FROZENDIRECTEDGRAPH GENERAL STATISTICS
+    def vertices_count(self):
+        """
+        Returns the number of vertices inside the Frozen Directed Graph
+        """
+        return len(self.__numbers)
+
+    def edges_count(self):
+        """
+        Returns the number of edges inside the Frozen Directed Graph
+        """
+        return len(self.__out_targets)
+
+    def has_negative_costs(self):
+        """
+        Returns True if at least one edge of the Frozen Directed Graph has a negative cost, False otherwise
+        ( The costs are scanned once, on the first call )
+        """
+        if self.__negative_costs is None:
+            self.__negative_costs = min(self.__out_costs, default=0) < 0
+        return self.__negative_costs
+
+    def topological_order(self):
+        """
+        Returns the list of the dense ids in a topological order ( every edge going from an earlier to a later vertex ),
+        or None if the Frozen Directed Graph has a cycle ( the list is shared, so it must not be modified )
+        Takes the vertices without inbound edges left one by one ( Kahn's algorithm ), in O(V+E), and stops as soon as
+        none is left before all are taken ( at once for a graph where every vertex has an inbound edge )
+        ( The order is computed once, on the first call )
+        """
+        if not self.__sorted:
+            n = len(self.__numbers)
+            offsets, targets, in_offsets = self.__out_offsets, self.__out_targets, self.__in_offsets
+
+            inbound = [in_offsets[vertex + 1] - in_offsets[vertex] for vertex in range(n)]
+            order = [vertex for vertex in range(n) if inbound[vertex] == 0]
+            for vertex in order:
+                for position in range(offsets[vertex], offsets[vertex + 1]):
+                    neighbour = targets[position]
+                    inbound[neighbour] -= 1
+                    if inbound[neighbour] == 0:
+                        order.append(neighbour)
+
+            self.__order = order if len(order) == n else None
+            self.__sorted = True
+        return self.__order
+
+    # CLASS FROZENDIRECTEDGRAPH PARTICULAR STATISTICS
+    def degree(self, vertex: int):
+        """
+        Returns the inbound, outbound edges count tuple
+        If the Vertex is not inside the Graph, returns None
+        :param vertex: Vertex to Search
+        """
+        dense_id = self.__index.get(vertex)
+        if dense_id is None:
+            return None
+
+        inbound = self.__in_offsets[dense_id + 1] - self.__in_offsets[dense_id]
+        outbound = self.__out_offsets[dense_id + 1] - self.__out_offsets[dense_id]
+
+        return inbound, outbound
+
+    # CLASS FROZENDIRECTEDGRAPH STRUCTURE GETTERS
+    def find_vertex(self, number: int):
+        """
+        Returns the vertex with the specified numberID if found, None otherwise
+        :param number: Source Vertex
+        """
+        if number in self.__index:
+            return Vertex(number)
+        return None
+
+    def __edge_position(self, source: int, target: int):
+        """
+        Returns the position of the edge inside the outbound arrays if found, None otherwise
+        :param source: Source Vertex
+        :param target: Target Vertex
+        """
+        source_id = self.__index.get(source)
+        target_id = self.__index.get(target)
+        if source_id is None or target_id is None:
+            return None
+
+        # Searching the row in place, without copying it ( array.index() for array('q') rows, a scan for the
+        # memoryviews of load_graph_binary(), which have no ranged index() )
+        targets = self.__out_targets
+        start = self.__out_offsets[source_id]
+        end = self.__out_offsets[source_id + 1]
+        if isinstance(targets, array):
+            try:
+                return targets.index(target_id, start, end)
+            except ValueError:
+                return None
+        for position in range(start, end):
+            if targets[position] == target_id:
+                return position
+        return None
+
+    def find_edge(self, source: int, target: int):
+        """
+        Returns the edge between to given vertices if found, None otherwise
+        :param source: Source Vertex
+        :param target: Target Vertex
+        """
+        if self.__edge_position(source, target) is None:
+            return None
+        return Edge(Vertex(source), Vertex(target))
+
+    def vertices(self):
+        """
+        Returns all the vertices inside the Frozen Directed Graph
+        """
+        return [Vertex(number) for number in self.__numbers]
+
+    def inbound_edges(self, vertex: int):
+        """
+        Returns all the inbound edges of a specified vertex inside the Frozen Directed Graph
+        If the vertex is not inside the Graph, return None
+
+        :param vertex: The ID number of the Vertex to analyze
+        """
+        dense_id = self.__index.get(vertex)
+        if dense_id is None:
+            return None
+
+        target = Vertex(vertex)
+        sources = self.__in_sources[self.__in_offsets[dense_id]:self.__in_offsets[dense_id + 1]]
+        return [Edge(Vertex(self.__numbers[source]), target) for source in sources]
+
+    def outbound_edges(self, vertex: int):
+        """
+        Returns all the outbound edges of a specified vertex inside the Frozen Directed Graph
+        If the vertex is not inside the Graph, return None
+
+        :param vertex: The ID number of the Vertex to analyze
+        """
+        dense_id = self.__index.get(vertex)
+        if dense_id is None:
+            return None
+
+        source = Vertex(vertex)
+        targets = self.__out_targets[self.__out_offsets[dense_id]:self.__out_offsets[dense_id + 1]]
+        return [Edge(source, Vertex(self.__numbers[target])) for target in targets]
+
+    def inbound_neighbours(self, vertex: int):
+        """
+        Returns an iterator over the ID numbers of the sources of the inbound edges of a specified vertex
+        If the vertex is not inside the Graph, return None
+
+        :param vertex: The ID number of the Vertex to analyze
+        """
+        dense_id = self.__index.get(vertex)
+        if dense_id is None:
+            return None
+
+        numbers = self.__numbers
+        return (numbers[self.__in_sources[position]]
+                for position in range(self.__in_offsets[dense_id], self.__in_offsets[dense_id + 1]))
+
+    def outbound_neighbours(self, vertex: int):
+        """
+        Returns an iterator over the ID numbers of the targets of the outbound edges of a specified vertex
+        If the vertex is not inside the Graph, return None
+
+        :param vertex: The ID number of the Vertex to analyze
+        """
+        dense_id = self.__index.get(vertex)
+        if dense_id is None:
+            return None
+
+        numbers = self.__numbers
+        return (numbers[self.__out_targets[position]]
+                for position in range(self.__out_offsets[dense_id], self.__out_offsets[dense_id + 1]))
+
+    def weighted_edges(self):
+        """
+        Yields every edge of the Frozen Directed Graph as a (source, target, cost) tuple of ID numbers and cost
+        ( cost is None for edges without a cost ), grouped by source in the order of vertices()
+        """
+        numbers = self.__numbers
+        offsets = self.__out_offsets
+        for source_id in range(len(numbers)):
+            source = numbers[source_id]
+            for position in range(offsets[source_id], offsets[source_id + 1]):
+                target_id = self.__out_targets[position]
+                if (source_id, target_id) in self.__uncosted:
+                    yield source, numbers[target_id], None
+                else:
+                    yield source, numbers[target_id], self.__out_costs[position]
+
+    # CLASS FROZENDIRECTEDGRAPH STRUCTURE ITERATORS
+    def vertex_iterator(self):
+        """
+        :return: Returns an Iterator of all Vertices inside the FrozenDirectedGraph
+        """
+        return DirectedGraphVertexIterator(self)
+
+    def outbound_iterator(self, vertex: int):
+        """
+        :return: Returns an Iterator of all Outbound Edges of a specified vertex, inside the FrozenDirectedGraph
+                 Raises DirectedGraphException if the Vertex is not inside the Graph
+        """
+        if not self.find_vertex(vertex):
+            raise DirectedGraphException("Vertex not inside the DirectedGraph")
+
+        return DirectedGraphOutboundIterator(self, vertex)
+
+    def inbound_iterator(self, vertex: int):
+        """
+        :return: Returns an Iterator of all Inbound Edges of a specified vertex, inside the FrozenDirectedGraph
+                 Raises DirectedGraphException if the Vertex is not inside the Graph
+        """
+        if not self.find_vertex(vertex):
+            raise DirectedGraphException("Vertex not inside the DirectedGraph")
+
+        return DirectedGraphInboundIterator(self, vertex)
+
+    # CLASS FROZENDIRECTEDGRAPH EDGE COST RELATED METHODS
+    def get_cost(self, source: int, target: int):
+        """
+        Gets the cost of an Edge ( specified by source and target ) and returns it
+        Returns None if either the Edge is not inside the Graph or does not have a cost
+
+        :param source: Source Vertex
+        :param target: Target Vertex
+        """
+        position = self.__edge_position(source, target)
+        if position is None:
+            return None
+        if (self.__index[source], self.__index[target]) in self.__uncosted:
+            return None
+
+        return self.__out_costs[position]
+
+    # CLASS STRUCTURE MODIFICATION METHODS
+    # The snapshot is immutable, every modification raises a DirectedGraphException
+    def modify_cost(self, source: int, target: int, cost: int):
+        raise DirectedGraphException("A FrozenDirectedGraph cannot be modified")
+
+    def add_vertex(self, vertex_number: int):
+        raise DirectedGraphException("A FrozenDirectedGraph cannot be modified")
+
+    def remove_vertex(self, vertex_number: int):
+        raise DirectedGraphException("A FrozenDirectedGraph cannot be modified")
+
+    def add_edge(self, source: int, target: int):
+        raise DirectedGraphException("A FrozenDirectedGraph cannot be modified")
+
+    def remove_edge(self, source: int, target: int):
+        raise DirectedGraphException("A FrozenDirectedGraph cannot be modified")
+
+    def freeze(self):
+        """
+        Returns the snapshot itself, as it is already immutable
+        """
+        return self
@@ -0,0 +1,133 @@
+# This module contains the representation of the class DisjointSet ( Union-Find )
+
+# DISJOINTSET CLASS IMPLEMENTATION
+# Internal Representation Specifications:
+# Every element ( any hashable value, usually a vertex ID number ) points to a parent element, the roots pointing to
+# themselves; the root of the tree of an element stands for its whole set
+# The sets are joined by size ( the smaller tree goes under the larger root ) and find() halves the paths it walks,
+# so every operation takes O(α(n)) amortized time, α being the inverse Ackermann function
+
+class DisjointSet:
+
+    # CLASS INITIALIZATION
+    def __init__(self, elements=()):
+        """
+        Initializes a new DisjointSet Object, every given element being alone in its set
+        :param elements: Optional iterable of the first elements
+        """
+        self.__parent = {}
+        self.__size = {}
+        self.__sets_count = 0
+
+        for element in elements:
+            self.add(element)
+
+    # CLASS DISJOINTSET GENERAL STATISTICS
+    def elements_count(self):
+        """
+        Returns the number of elements inside the DisjointSet
+        """
+        return len(self.__parent)
+
+    def sets_count(self):
+        """
+        Returns the number of disjoint sets inside the DisjointSet
+        """
+        return self.__sets_count
+
+    def __contains__(self, element):
+        """
+        Checks if the element is inside the DisjointSet
+        """
+        return element in self.__parent
+
+    # CLASS DISJOINTSET OPERATIONS
+    def add(self, element):
+        """
+        Adds the element alone in a new set, if it is not inside the DisjointSet already
+        :param element: The element to add
+        """
+        if element not in self.__parent:
+            self.__parent[element] = element
+            self.__size[element] = 1
+            self.__sets_count += 1
+
+    def find(self, element):
+        """
+        Returns the root ( representative ) element of the set of the given element
+        If the element is not inside the DisjointSet, returns None
+        :param element: The element to search
+        """
+        parent = self.__parent
+        if element not in parent:
+            return None
+
+        while parent[element] != element:
+            parent[element] = parent[parent[element]]
+            element = parent[element]
+        return element
+
+    def union(self, first, second):
+        """
+        Joins the sets of the two elements ( adding the elements first if needed )
+        Returns True if they were in different sets, False otherwise
+        :param first: The first element
+        :param second: The second element
+        """
+        self.add(first)
+        self.add(second)
+        first, second = self.find(first), self.find(second)
+        if first == second:
+            return False
+
+        if self.__size[first] < self.__size[second]:
+            first, second = second, first
+        self.__parent[second] = first
+        self.__size[first] += self.__size.pop(second)
+        self.__sets_count -= 1
+        return True
+
+    def remove(self, elements):
+        """
+        Removes the given elements from the DisjointSet
+        The elements must make up whole sets ( every other element of their sets is given too ), since the
+        remaining elements could otherwise still point to them
+        :param elements: Iterable of the elements to remove
+        """
+        elements = [element for element in elements if element in self.__parent]
+        for element in elements:
+            if self.__parent[element] == element:
+                del self.__size[element]
+                self.__sets_count -= 1
+        for element in elements:
+            del self.__parent[element]
+
+    def connected(self, first, second):
+        """
+        Checks if the two elements are inside the same set ( False if either is not inside the DisjointSet )
+        :param first: The first element
+        :param second: The second element
+        """
+        root = self.find(first)
+        return root is not None and root == self.find(second)
+
+    def set_size(self, element):
+        """
+        Returns the number of elements of the set of the given element
+        If the element is not inside the DisjointSet, returns None
+        :param element: The element to search
+        """
+        root = self.find(element)
+        if root is None:
+            return None
+        return self.__size[root]
+
+    def sets(self):
+        """
+        Returns the list of all the sets, as lists of elements
+        The sets come in the order of their first added element, and keep the elements in the order they were added
+        """
+        groups = {}
+        for element in self.__parent:
+            groups.setdefault(self.find(element), []).append(element)
+        return list(groups.values())
@@ -0,0 +1,123 @@
+# This module contains the representation of the class IndexedHeap ( Binary Heap with Decrease-Key )
+
+# INDEXEDHEAP CLASS IMPLEMENTATION
+# Internal Representation Specifications:
+# The items are the dense ids 0...capacity-1, kept in a binary min-heap ordered by their keys ( ties by item )
+# The position of every item inside the heap is kept too ( -1 if the item is not inside the heap ), so the key of
+# an item already inside the heap can be lowered in place, instead of pushing a second, stale entry
+
+class IndexedHeap:
+
+    # CLASS INITIALIZATION
+    def __init__(self, capacity: int):
+        """
+        Initializes a new empty IndexedHeap Object, for the items 0...capacity-1
+        :param capacity: The number of possible items
+        """
+        self.__heap = []
+        self.__keys = [None] * capacity
+        self.__positions = [-1] * capacity
+
+    # CLASS INDEXEDHEAP GENERAL STATISTICS
+    def __len__(self):
+        """
+        Returns the number of items inside the IndexedHeap
+        """
+        return len(self.__heap)
+
+    def __contains__(self, item: int):
+        """
+        Checks if the item is inside the IndexedHeap
+        """
+        return self.__positions[item] != -1
+
+    def key(self, item: int):
+        """
+        Returns the key of an item inside the IndexedHeap, None if the item is not inside it
+        :param item: The item to search
+        """
+        if self.__positions[item] == -1:
+            return None
+        return self.__keys[item]
+
+    # CLASS INDEXEDHEAP OPERATIONS
+    def push(self, item: int, key):
+        """
+        Adds the item with the given key, or lowers its key if it is inside the IndexedHeap with a bigger one
+        Returns True if the item was added or its key lowered, False otherwise
+        :param item: The item to add
+        :param key: The key of the item
+        """
+        position = self.__positions[item]
+        if position == -1:
+            position = len(self.__heap)
+            self.__heap.append(item)
+        elif not key < self.__keys[item]:
+            return False
+
+        self.__keys[item] = key
+        self.__sift_up(position)
+        return True
+
+    def pop(self):
+        """
+        Removes the item with the smallest key and returns the ( item, key ) tuple
+        Raises IndexError if the IndexedHeap is empty
+        """
+        heap = self.__heap
+        item = heap[0]
+        last = heap.pop()
+        self.__positions[item] = -1
+        if heap:
+            heap[0] = last
+            self.__positions[last] = 0
+            self.__sift_down(0)
+
+        return item, self.__keys[item]
+
+    # CLASS INDEXEDHEAP ORDER RESTORATION
+    def __sift_up(self, position: int):
+        """
+        Moves the item at the given position up, until its parent is not bigger
+        """
+        heap, keys, positions = self.__heap, self.__keys, self.__positions
+        item = heap[position]
+        entry = (keys[item], item)
+        while position > 0:
+            parent_position = (position - 1) >> 1
+            parent = heap[parent_position]
+            if not entry < (keys[parent], parent):
+                break
+            heap[position] = parent
+            positions[parent] = position
+            position = parent_position
+
+        heap[position] = item
+        positions[item] = position
+
+    def __sift_down(self, position: int):
+        """
+        Moves the item at the given position down, until no child is smaller
+        """
+        heap, keys, positions = self.__heap, self.__keys, self.__positions
+        size = len(heap)
+        item = heap[position]
+        entry = (keys[item], item)
+        while True:
+            child_position = 2 * position + 1
+            if child_position >= size:
+                break
+            child = heap[child_position]
+            if child_position + 1 < size:
+                other = heap[child_position + 1]
+                if (keys[other], other) < (keys[child], child):
+                    child_position += 1
+                    child = other
+            if not (keys[child], child) < entry:
+                break
+            heap[position] = child
+            positions[child] = position
+            position = child_position
+
+        heap[position] = item
+        positions[item] = position
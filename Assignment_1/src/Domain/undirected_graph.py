@@ -1,7 +1,10 @@
 # This module contains the representation of the class DirectedGraph
 # Imports Section
+from array import array
+from itertools import repeat
 from .edge import Edge
 from .vertex import Vertex
+from .disjoint_set import DisjointSet
 from .edge import UEdge
 from .directed_graph import DirectedGraph
 
@@ -91,27 +94,34 @@ class UnDirectedGraphEdgesIterator:
 
 # UNDIRECTEDGRAPH CLASS IMPLEMENTATION
 # Internal Representation Specifications:
-# We keep 2 dictionaries for efficiency in getting the edges of a vertex, and one for the cost of an edge
-# The edges dictionary takes as keys the vertices and as values a list of the edges
-# The costs dictionary takes as keys the edges and as values the costs
+# We keep 1 dictionary for efficiency in getting the edges of a vertex, or cost of an edge
+# The edges dictionary takes as keys the vertex ID numbers and as values the adjacency of that vertex
+# An adjacency is an insertion-ordered dictionary from the neighbour ID number to the cost of the edge ( None if no cost )
+# Every edge is kept in the adjacency of both its ends, so finding an edge or its cost is O(1) in either direction
+# With track_components, a DisjointSet of the vertices follows the connected components: added vertices and edges
+# join sets at once, while removals only mark their vertices as dirty, and the next query searches again
+# the components of the dirty vertices alone ( every piece of a split component holds a dirty vertex )
 
 class UnDirectedGraph:
 
     # CLASS INITIALIZATION
-    def __init__(self):
+    def __init__(self, track_components: bool = False):
         """
         Initializes a new UnDirectedGraph Object
+        :param track_components: Whether to keep the connected components up to date on every modification
         """
 
         # Number of vertices in the Graph is initially zero
         self.__verticesCount = 0
         self.__edgesCount = 0
 
-        # Neighbours are initially empty
+        # Neighbours ( and the Costs of the Edges ) are initially empty
         self.__edges = {}
 
-        # Costs of the Edges of the Graphs is initially empty
-        self.__costs = {}
+        # Connected components ( kept only if tracked ), vertices touched by removals, and the cached components list
+        self.__components = DisjointSet() if track_components else None
+        self.__dirty = set()
+        self.__components_cache = None
 
     # CLASS DIRECTEDGRAPH GENERAL STATISTICS
     def vertices_count(self):
@@ -133,16 +143,10 @@ class UnDirectedGraph:
         If the Vertex is not inside the Graph, returns None
         :param vertex: Vertex to Search
         """
-        vertex = self.find_vertex(vertex)
-        if not vertex:
+        if vertex not in self.__edges:
             return None
 
-        degree = 0
-
-        if vertex in self.__edges.keys():
-            degree = len(self.__edges[vertex])
-
-        return degree
+        return len(self.__edges[vertex])
 
     # CLASS DIRECTEDGRAPH STRUCTURE GETTERS
     def find_vertex(self, number: int):
@@ -150,10 +154,8 @@ class UnDirectedGraph:
         Returns the vertex with the specified numberID if found, None otherwise
         :param number: Source Vertex
         """
-        vertex = Vertex(number)
-
-        if vertex in self.__edges.keys():
-            return vertex
+        if number in self.__edges:
+            return Vertex(number)
         return None
 
     def find_edge(self, source: int, target: int):
@@ -162,29 +164,17 @@ class UnDirectedGraph:
         :param source: Source Vertex
         :param target: Target Vertex
         """
-        source = self.find_vertex(source)
-        target = self.find_vertex(target)
-        edge = UEdge(source, target)
-
-        if (not source) or (not target):
+        adjacency = self.__edges.get(source)
+        if adjacency is None or target not in adjacency:
             return None
 
-        if edge in self.__edges[source]:
-            return edge
-        if edge in self.__edges[target]:
-            return edge
-        return None
+        return UEdge(Vertex(source), Vertex(target))
 
     def vertices(self):
         """
         Returns all the vertices inside the Directed Graph
         """
-
-        vertices_list = []
-        for vertex in self.__edges.keys():
-            vertices_list.append(vertex)
-
-        return vertices_list.copy()
+        return [Vertex(number) for number in self.__edges.keys()]
 
     def get_edges(self, vertex: int):
         """
@@ -193,12 +183,35 @@ class UnDirectedGraph:
 
         :param vertex: The ID number of the Vertex to analyze
         """
+        if vertex not in self.__edges:
+            return None
 
-        vertex = self.find_vertex(vertex)
-        if not vertex:
+        source = Vertex(vertex)
+        return [UEdge(source, Vertex(target)) for target in self.__edges[vertex]]
+
+    def neighbours(self, vertex: int):
+        """
+        Returns an iterator over the ID numbers of the neighbours of a specified vertex inside the UnDirected Graph
+        ( Read straight from the adjacency, without copying it; the graph must not change while it is used )
+        If the vertex is not inside the Graph, return None
+
+        :param vertex: The ID number of the Vertex to analyze
+        """
+        if vertex not in self.__edges:
             return None
 
-        return self.__edges[vertex].copy()
+        return iter(self.__edges[vertex])
+
+    def weighted_edges(self):
+        """
+        Yields every edge of the UnDirected Graph once, as a (source, target, cost) tuple of ID numbers and cost
+        ( cost is None for edges without a cost ), each edge being given from its smaller end ( source <= target )
+        The edges are read straight from the adjacency, without copying it or creating Vertex / Edge objects
+        """
+        for (source, adjacency) in self.__edges.items():
+            for (target, cost) in adjacency.items():
+                if source <= target:
+                    yield source, target, cost
 
     # CLASS DIRECTEDGRAPH STRUCTURE ITERATORS
     def vertex_iterator(self):
@@ -227,19 +240,11 @@ class UnDirectedGraph:
         :param source: Source Vertex
         :param target: Target Vertex
         """
-
-        edge = self.find_edge(source, target)
-        if not edge:
+        adjacency = self.__edges.get(source)
+        if adjacency is None:
             return None
 
-        opposite_edge = UEdge(Vertex(target), Vertex(source))
-        if (edge not in self.__costs.keys()) and (opposite_edge not in self.__costs.keys()):
-            return None
-
-        if edge not in self.__costs.keys():
-            return self.__costs[opposite_edge]
-        else:
-            return self.__costs[edge]
+        return adjacency.get(target)
 
     def modify_cost(self, source: int, target: int, cost: int):
         """
@@ -250,12 +255,12 @@ class UnDirectedGraph:
         :param target: Target Vertex
         :param cost: New Edge Cost
         """
-
-        edge = self.find_edge(source, target)
-        if not edge:
+        adjacency = self.__edges.get(source)
+        if adjacency is None or target not in adjacency:
             return None
 
-        self.__costs[edge] = cost
+        adjacency[target] = cost
+        self.__edges[target][source] = cost
 
         return cost
 
@@ -268,15 +273,16 @@ class UnDirectedGraph:
 
         :param vertex_number: The ID number of the Vertex
         """
-        vertex = self.find_vertex(vertex_number)
-        if vertex:
+        if vertex_number in self.__edges:
             return None
 
-        vertex = Vertex(vertex_number)
         self.__verticesCount += 1
-        self.__edges[vertex] = []
+        self.__edges[vertex_number] = {}
+        if self.__components is not None:
+            self.__components.add(vertex_number)
+            self.__components_cache = None
 
-        return vertex
+        return Vertex(vertex_number)
 
     def remove_vertex(self, vertex_number: int):
         """
@@ -290,16 +296,18 @@ class UnDirectedGraph:
 
         # If vertex inside the graph, remove it
         # Otherwise return None
-        vertex = self.find_vertex(vertex_number)
-        if not vertex:
+        if vertex_number not in self.__edges:
             return None
 
         self.__verticesCount -= 1
-        for edge in self.__edges[vertex]:
-            self.remove_edge(edge.source.number, edge.target.number)
-        del self.__edges[vertex]
+        for target in list(self.__edges[vertex_number]):
+            self.remove_edge(vertex_number, target)
+        del self.__edges[vertex_number]
+        if self.__components is not None:
+            self.__dirty.add(vertex_number)
+            self.__components_cache = None
 
-        return vertex
+        return Vertex(vertex_number)
 
     def add_edge(self, source: int, target: int):
         """
@@ -309,23 +317,82 @@ class UnDirectedGraph:
         :param source: Source Vertex
         :param target: Target Vertex
         """
-        source = Vertex(source)
-        target = Vertex(target)
-        edge = UEdge(source, target)
-
-        if self.find_edge(source.number, target.number):
+        if self.find_edge(source, target):
             return None
 
-        if target not in self.__edges.keys():
-            self.add_vertex(target.number)
-        if source not in self.__edges.keys():
-            self.add_vertex(source.number)
+        if target not in self.__edges:
+            self.add_vertex(target)
+        if source not in self.__edges:
+            self.add_vertex(source)
 
         self.__edgesCount += 1
-        self.__edges[source].append(edge)
-        self.__edges[target].append(edge)
+        self.__edges[source][target] = None
+        self.__edges[target][source] = None
+        if self.__components is not None:
+            self.__components.union(source, target)
+            self.__components_cache = None
 
-        return edge
+        return UEdge(Vertex(source), Vertex(target))
+
+    # CLASS BULK MODIFICATION METHODS
+    # Add many Edges ( and their Costs ) in a single pass
+    def add_edges_from(self, edges, targets=None, costs=None):
+        """
+        Adds many Edges to the UnDirected Graph in one pass and returns the number of newly added edges
+        If either the source or target vertices not in the graph, add them
+        Duplicate edges ( in either direction ) are only added once, the last given cost is the one kept
+
+        :param edges: Iterable of (source, target) tuples, or the array of sources if targets is given
+        :param targets: Optional array of targets, parallel to the array of sources
+        :param costs: Optional array of costs, parallel to the edges ( existing costs are kept if missing )
+        """
+        if costs is None:
+            costs = repeat(None)
+        if targets is not None:
+            return self.__add_weighted_edges(zip(edges, targets, costs))
+
+        return self.__add_weighted_edges((source, target, cost) for ((source, target), cost) in zip(edges, costs))
+
+    def add_weighted_edges_from(self, edges):
+        """
+        Adds many Edges with their Costs to the UnDirected Graph in one pass and returns the number of new edges
+        If either the source or target vertices not in the graph, add them
+        Duplicate edges ( in either direction ) are only added once, the last given cost is the one kept
+
+        :param edges: Iterable of (source, target, cost) tuples
+        """
+        return self.__add_weighted_edges(edges)
+
+    def __add_weighted_edges(self, edges):
+        """
+        Adds (source, target, cost) Edges directly into the adjacency dictionary and returns the number of new edges
+        A cost of None leaves the cost of an already existing edge unchanged
+        """
+        adjacencies = self.__edges
+        components = self.__components
+        added = 0
+
+        for (source, target, cost) in edges:
+            if target not in adjacencies:
+                self.add_vertex(target)
+            adjacency = adjacencies.get(source)
+            if adjacency is None:
+                self.add_vertex(source)
+                adjacency = adjacencies[source]
+
+            if target not in adjacency:
+                added += 1
+                if components is not None:
+                    components.union(source, target)
+            elif cost is None:
+                continue
+            adjacency[target] = cost
+            adjacencies[target][source] = cost
+
+        self.__edgesCount += added
+        if added and components is not None:
+            self.__components_cache = None
+        return added
 
     def remove_edge(self, source: int, target: int):
         """
@@ -338,32 +405,408 @@ class UnDirectedGraph:
 
         # If edge inside the graph, remove it
         # Otherwise return None
-        edge = self.find_edge(source, target)
-
-        if not edge:
+        if not self.find_edge(source, target):
             return None
 
         self.__edgesCount -= 1
-        self.__edges[Vertex(target)].remove(edge)
+        self.__edges[source].pop(target)
+        self.__edges[target].pop(source, None)
+        if self.__components is not None:
+            self.__dirty.update((source, target))
+            self.__components_cache = None
 
-        return edge.source, edge.target
+        return Vertex(source), Vertex(target)
+
+    # CLASS CONNECTED COMPONENTS METHODS
+    def tracks_components(self):
+        """
+        Checks if the UnDirected Graph keeps its connected components up to date
+        """
+        return self.__components is not None
+
+    def component_of(self, vertex: int):
+        """
+        Returns the ID number of the representative vertex of the connected component of a specified vertex
+        ( Two vertices are in the same component if and only if they get the same representative, until the next
+        modification of the graph ); if the vertex is not inside the Graph, returns None
+        Raises UnDirectedGraphException if the graph does not track its components
+
+        :param vertex: The ID number of the Vertex to analyze
+        """
+        self.__refresh_components()
+        return self.__components.find(vertex)
+
+    def same_component(self, source: int, target: int):
+        """
+        Checks if two vertices are inside the same connected component ( False if either is not inside the Graph )
+        Raises UnDirectedGraphException if the graph does not track its components
+
+        :param source: The ID number of the first Vertex
+        :param target: The ID number of the second Vertex
+        """
+        self.__refresh_components()
+        return self.__components.connected(source, target)
+
+    def components(self):
+        """
+        Returns the list of all connected components, as lists of vertex ID numbers
+        The list is cached, and given again as long as the graph does not change
+        Raises UnDirectedGraphException if the graph does not track its components
+        """
+        if self.__components_cache is None:
+            self.__refresh_components()
+            self.__components_cache = self.__components.sets()
+        return self.__components_cache
+
+    def __refresh_components(self):
+        """
+        Brings the tracked connected components up to date with the removals done since the last query
+        Raises UnDirectedGraphException if the graph does not track its components
+        """
+        if self.__components is None:
+            raise UnDirectedGraphException("The UnDirectedGraph does not track its connected components")
+        if not self.__dirty:
+            return
+
+        # Searching again from every dirty vertex still inside the graph, which reaches the whole of every
+        # component the removals may have split
+        pieces = []
+        searched = set()
+        for vertex in self.__dirty:
+            if vertex not in self.__edges or vertex in searched:
+                continue
+            searched.add(vertex)
+            piece = [vertex]
+            for member in piece:
+                for neighbour in self.__edges[member]:
+                    if neighbour not in searched:
+                        searched.add(neighbour)
+                        piece.append(neighbour)
+            pieces.append(piece)
+
+        # Replacing the sets of all the searched ( and removed ) vertices by the pieces found
+        self.__components.remove(searched | self.__dirty)
+        for piece in pieces:
+            for member in piece:
+                self.__components.union(piece[0], member)
+        self.__dirty.clear()
 
     # CLASS COPY CREATION METHOD
     def copy(self):
         """
-        Returns a deep copy of the current state of the DirectedGraph
-        ( Creates a new DirectedGraph with the same vertices and edges )
+        Returns a deep copy of the current state of the UnDirectedGraph
+        ( Creates a new UnDirectedGraph with the same vertices and edges )
         """
 
         # Graph Structure
-        graph_copy = DirectedGraph()
-
-        # Copying all vertices and edges
-        for edge in self.__edges.values():
-            graph_copy.add_edge(edge.source.number, edge.target.number)
+        graph_copy = UnDirectedGraph(self.tracks_components())
 
-        # Copying all costs
-        for (edge, cost) in self.__costs:
-            graph_copy.modify_cost(edge.source.number, edge.target.number, cost)
+        # Copying all vertices, then all edges and their costs
+        for vertex in self.__edges.keys():
+            graph_copy.add_vertex(vertex)
+        for (source, adjacency) in self.__edges.items():
+            for (target, cost) in adjacency.items():
+                if graph_copy.add_edge(source, target):
+                    graph_copy.modify_cost(source, target, cost)
 
         return graph_copy
+
+    # CLASS FROZEN SNAPSHOT CREATION METHOD
+    def freeze(self):
+        """
+        Returns an immutable CSR ( compressed sparse row ) snapshot of the current state of the UnDirectedGraph
+        ( Vertices get dense ids 0...n-1 in the order of vertices(), every edge is stored in the rows of both ends )
+        """
+
+        # Dense ids of the vertices
+        vertex_numbers = list(self.__edges.keys())
+        index = {number: dense_id for (dense_id, number) in enumerate(vertex_numbers)}
+
+        # Edges without an associated cost, as (smaller id, bigger id) pairs
+        uncosted = set()
+
+        # Neighbouring rows, in the order of get_edges()
+        offsets = array('q', [0])
+        targets = array('q')
+        costs = array('q')
+        for (vertex, adjacency) in self.__edges.items():
+            for (neighbour, cost) in adjacency.items():
+                if cost is None:
+                    pair = (index[vertex], index[neighbour])
+                    uncosted.add((min(pair), max(pair)))
+                    cost = 0
+                targets.append(index[neighbour])
+                costs.append(cost)
+            offsets.append(len(targets))
+
+        return FrozenUnDirectedGraph(vertex_numbers, offsets, targets, costs, uncosted, self.__edgesCount)
+
+
+# FROZENUNDIRECTEDGRAPH CLASS IMPLEMENTATION
+# Internal Representation Specifications:
+# Vertices are mapped to dense ids 0...n-1, and the edges are kept in CSR ( compressed sparse row ) form
+# The edges of the vertex with id i lead to targets[offsets[i]:offsets[i+1]], with costs alongside
+# Every edge is stored twice, once in the row of each of its ends
+# The snapshot is read-only: it offers the getters / iterators of the UnDirectedGraph, but no modification methods
+
+class FrozenUnDirectedGraph:
+
+    # CLASS INITIALIZATION
+    def __init__(self, vertex_numbers, offsets, targets, costs, uncosted, edges_count):
+        """
+        Initializes a new FrozenUnDirectedGraph Object from already built CSR arrays
+        ( Use UnDirectedGraph.freeze() or io_file_services.load_graph_binary() to get one )
+        """
+        self.__numbers = vertex_numbers
+        self.__index = {number: dense_id for (dense_id, number) in enumerate(vertex_numbers)}
+
+        self.__offsets = offsets
+        self.__targets = targets
+        self.__costs = costs
+
+        self.__uncosted = frozenset(uncosted)
+        self.__edgesCount = edges_count
+
+    # CLASS CSR PROPERTIES
+    @property
+    def vertex_numbers(self):
+        """
+        :return: The list of the vertex ID numbers, indexed by dense id
+        """
+        return self.__numbers
+
+    @property
+    def offsets(self):
+        """
+        :return: The offsets array of the rows ( length vertices_count() + 1 )
+        """
+        return self.__offsets
+
+    @property
+    def targets(self):
+        """
+        :return: The dense ids of the neighbours on each row
+        """
+        return self.__targets
+
+    @property
+    def costs(self):
+        """
+        :return: The costs of the edges on each row ( 0 for edges without a cost )
+        """
+        return self.__costs
+
+    @property
+    def uncosted_edges(self):
+        """
+        :return: The set of (smaller id, bigger id) pairs of the edges without an associated cost
+        """
+        return self.__uncosted
+
+    def index_of(self, number: int):
+        """
+        Returns the dense id of the vertex with the specified numberID if found, None otherwise
+        :param number: The ID number of the Vertex
+        """
+        return self.__index.get(number)
+
+    # CLASS FROZENUNDIRECTEDGRAPH PICKLING
+    def __reduce__(self):
+        """
+        Pickles the Frozen UnDirected Graph with its CSR arrays copied into array('q') ( the memoryviews over the file
+        pages of a graph given by load_graph_binary() cannot be pickled ), e.g. to send it to a worker process
+        """
+        return FrozenUnDirectedGraph, (list(self.__numbers), array('q', self.__offsets), array('q', self.__targets),
+                                       array('q', self.__costs), self.__uncosted, self.__edgesCount)
+
+    # CLASS FROZENUNDIRECTEDGRAPH GENERAL STATISTICS
+    def vertices_count(self):
+        """
+        Returns the number of vertices inside the Frozen UnDirected Graph
+        """
+        return len(self.__numbers)
+
+    def edges_count(self):
+        """
+        Returns the number of edges inside the Frozen UnDirected Graph
+        """
+        return self.__edgesCount
+
+    # CLASS FROZENUNDIRECTEDGRAPH PARTICULAR STATISTICS
+    def degree(self, vertex: int):
+        """
+        Returns the neighbouring edges count
+        If the Vertex is not inside the Graph, returns None
+        :param vertex: Vertex to Search
+        """
+        dense_id = self.__index.get(vertex)
+        if dense_id is None:
+            return None
+
+        return self.__offsets[dense_id + 1] - self.__offsets[dense_id]
+
+    # CLASS FROZENUNDIRECTEDGRAPH STRUCTURE GETTERS
+    def find_vertex(self, number: int):
+        """
+        Returns the vertex with the specified numberID if found, None otherwise
+        :param number: Source Vertex
+        """
+        if number in self.__index:
+            return Vertex(number)
+        return None
+
+    def __edge_position(self, source: int, target: int):
+        """
+        Returns the position of the edge inside the row of the source if found, None otherwise
+        :param source: Source Vertex
+        :param target: Target Vertex
+        """
+        source_id = self.__index.get(source)
+        target_id = self.__index.get(target)
+        if source_id is None or target_id is None:
+            return None
+
+        # Searching the row in place, without copying it ( array.index() for array('q') rows, a scan for the
+        # memoryviews of load_graph_binary(), which have no ranged index() )
+        targets = self.__targets
+        start = self.__offsets[source_id]
+        end = self.__offsets[source_id + 1]
+        if isinstance(targets, array):
+            try:
+                return targets.index(target_id, start, end)
+            except ValueError:
+                return None
+        for position in range(start, end):
+            if targets[position] == target_id:
+                return position
+        return None
+
+    def find_edge(self, source: int, target: int):
+        """
+        Returns the edge between to given vertices if found, None otherwise
+        :param source: Source Vertex
+        :param target: Target Vertex
+        """
+        if self.__edge_position(source, target) is None:
+            return None
+        return UEdge(Vertex(source), Vertex(target))
+
+    def vertices(self):
+        """
+        Returns all the vertices inside the Frozen UnDirected Graph
+        """
+        return [Vertex(number) for number in self.__numbers]
+
+    def get_edges(self, vertex: int):
+        """
+        Returns all the edges of a specified vertex inside the Frozen UnDirected Graph
+        If the vertex is not inside the Graph, return None
+
+        :param vertex: The ID number of the Vertex to analyze
+        """
+        dense_id = self.__index.get(vertex)
+        if dense_id is None:
+            return None
+
+        source = Vertex(vertex)
+        targets = self.__targets[self.__offsets[dense_id]:self.__offsets[dense_id + 1]]
+        return [UEdge(source, Vertex(self.__numbers[target])) for target in targets]
+
+    def neighbours(self, vertex: int):
+        """
+        Returns an iterator over the ID numbers of the neighbours of a specified vertex inside the Frozen Graph
+        If the vertex is not inside the Graph, return None
+
+        :param vertex: The ID number of the Vertex to analyze
+        """
+        dense_id = self.__index.get(vertex)
+        if dense_id is None:
+            return None
+
+        numbers = self.__numbers
+        return (numbers[self.__targets[position]]
+                for position in range(self.__offsets[dense_id], self.__offsets[dense_id + 1]))
+
+    def weighted_edges(self):
+        """
+        Yields every edge of the Frozen UnDirected Graph once, as a (source, target, cost) tuple of ID numbers and cost
+        ( cost is None for edges without a cost ), each edge being given from its smaller end ( source <= target )
+        """
+        numbers = self.__numbers
+        offsets = self.__offsets
+        for source_id in range(len(numbers)):
+            source = numbers[source_id]
+            for position in range(offsets[source_id], offsets[source_id + 1]):
+                target_id = self.__targets[position]
+                target = numbers[target_id]
+                if source > target:
+                    continue
+                if (min(source_id, target_id), max(source_id, target_id)) in self.__uncosted:
+                    yield source, target, None
+                else:
+                    yield source, target, self.__costs[position]
+
+    def tracks_components(self):
+        """
+        Checks if the graph keeps its connected components up to date ( never, for a Frozen UnDirected Graph )
+        """
+        return False
+
+    # CLASS FROZENUNDIRECTEDGRAPH STRUCTURE ITERATORS
+    def vertex_iterator(self):
+        """
+        :return: Returns an Iterator of all Vertices inside the FrozenUnDirectedGraph
+        """
+        return UnDirectedGraphVertexIterator(self)
+
+    def edges_iterator(self, vertex: int):
+        """
+        :return: Returns an Iterator of all Edges of a specified vertex, inside the FrozenUnDirectedGraph
+                 Raises UnDirectedGraphException if the Vertex is not inside the Graph
+        """
+        if not self.find_vertex(vertex):
+            raise UnDirectedGraphException("Vertex not inside the UnDirectedGraph")
+
+        return UnDirectedGraphEdgesIterator(self, vertex)
+
+    # CLASS FROZENUNDIRECTEDGRAPH EDGE COST RELATED METHODS
+    def get_cost(self, source: int, target: int):
+        """
+        Gets the cost of an Edge ( specified by source and target ) and returns it
+        Returns None if either the Edge is not inside the Graph or does not have a cost
+
+        :param source: Source Vertex
+        :param target: Target Vertex
+        """
+        position = self.__edge_position(source, target)
+        if position is None:
+            return None
+
+        pair = (self.__index[source], self.__index[target])
+        if (min(pair), max(pair)) in self.__uncosted:
+            return None
+
+        return self.__costs[position]
+
+    # CLASS STRUCTURE MODIFICATION METHODS
+    # The snapshot is immutable, every modification raises an UnDirectedGraphException
+    def modify_cost(self, source: int, target: int, cost: int):
+        raise UnDirectedGraphException("A FrozenUnDirectedGraph cannot be modified")
+
+    def add_vertex(self, vertex_number: int):
+        raise UnDirectedGraphException("A FrozenUnDirectedGraph cannot be modified")
+
+    def remove_vertex(self, vertex_number: int):
+        raise UnDirectedGraphException("A FrozenUnDirectedGraph cannot be modified")
+
+    def add_edge(self, source: int, target: int):
+        raise UnDirectedGraphException("A FrozenUnDirectedGraph cannot be modified")
+
+    def remove_edge(self, source: int, target: int):
+        raise UnDirectedGraphException("A FrozenUnDirectedGraph cannot be modified")
+
+    def freeze(self):
+        """
+        Returns the snapshot itself, as it is already immutable
+        """
+        return self
@@ -1,9 +1,23 @@
 # This module contains the functionality for getting the Connected Components of an Undirected Graph
 # Includes Section
+from contextlib import nullcontext
+try:
+    import numpy
+except ImportError:
+    numpy = None
 from Assignment_1.src.Domain.vertex import Vertex
 from Assignment_1.src.Domain.edge import Edge, UEdge
+from Assignment_1.src.Domain.disjoint_set import DisjointSet
 from Assignment_1.src.Domain.undirected_graph import (UnDirectedGraph, UnDirectedGraphVertexIterator,
                                                       UnDirectedGraphEdgesIterator, UnDirectedGraphException)
+from Assignment_1.src.Services.io_file_services import compression_codec, read_edge_chunks, parse_edges
+
+
+# Definition Section
+# Engines able to compute the connected components of a graph
+DEPTH_FIRST = "depth-first"
+UNION_FIND = "union-find"
+LABEL_PROPAGATION = "label-propagation"
 
 
 # DEPTH FIRST SEARCH ALGORITHM
@@ -12,36 +26,169 @@ def depth_first_search(graph, vertex, visited, component):
     Perform depth-first search in the given graph
     Starts from the given vertex
     Adds the visited vertices to the connected component.
+
+    The search keeps an explicit stack of neighbour iterators instead of recursing, so long path-like components
+    do not reach the recursion limit; it visits the vertices in the same order as the recursive search would
+    ( O(V+E) time, O(V) extra memory, the adjacencies being read without copying them )
+
+    :param graph: The given Graph
+    :param vertex: The Vertex to start from
+    :param visited: The set of the ID numbers of the visited vertices, updated by the search
+    :param component: The list the ID numbers of the visited vertices get appended to
     """
 
     # Adding the new vertex to the given component and visit it
-    visited.add(vertex)
+    visited.add(vertex.number)
     component.append(vertex.number)
+    stack = [graph.neighbours(vertex.number)]
 
-    # Iterating all neighbouring edges
-    iterator = graph.edges_iterator(vertex.number)
-    while iterator.valid():
+    while stack:
+        # Going in depth for the next not visited neighbour of the deepest vertex
+        new_vertex = next((neighbour for neighbour in stack[-1] if neighbour not in visited), None)
+        if new_vertex is None:
+            stack.pop()
+            continue
 
-        # Getting the next vertex
-        edge = iterator.getCurrent()
-        if vertex != edge.target:
-            new_vertex = edge.target
-        else:
-            new_vertex = edge.source
+        visited.add(new_vertex)
+        component.append(new_vertex)
+        stack.append(graph.neighbours(new_vertex))
 
-        # Going in depth for the new vertex
-        if new_vertex not in visited:
-            depth_first_search(graph, new_vertex, visited, component)
 
-        iterator.next()
+# UNION-FIND ALGORITHM
+def union_find_components(edges, vertices=()):
+    """
+    Returns the list of the connected components of the graph made of the given edges and vertices
+    The edges are streamed into a DisjointSet, so no adjacency is ever built ( O(V) memory, whatever E is )
+    The components come in the order of their first vertex seen, and keep the vertices in the order they were seen
+
+    :param edges: Iterable of (source, target) or (source, target, cost) tuples of vertex ID numbers
+    :param vertices: Optional iterable of vertex ID numbers, so isolated vertices get their own components
+    """
+    sets = DisjointSet(vertices)
+    for edge in edges:
+        sets.union(edge[0], edge[1])
+
+    return sets.sets()
+
+
+def connected_components_from_file(file_path):
+    """
+    Returns the list of the connected components of the graph stored in the file at file_path, in the format read by
+    read_graph(), without loading it into an UnDirectedGraph: the edge lines are parsed in blocks and streamed
+    into union_find_components(), so a file too large for an UnDirectedGraph can still be processed
+    ( Only vertices having edges are known from the file; compressed files are read like in read_graph() )
+    Raises UnDirectedGraphException for an invalid file_path or any other file reading related issues
+
+    :param file_path: The file path of the file to read from
+    """
+    def stream_edges(file):
+        file.readline()
+        for chunk in read_edge_chunks(file):
+            sources, targets, _ = parse_edges(chunk)
+            yield from zip(sources, targets)
+
+    try:
+        codec = compression_codec(file_path)
+        with open(file_path, 'rb') as raw, codec.open(raw, 'rb') if codec else nullcontext(raw) as file:
+            return union_find_components(stream_edges(file))
+
+    except Exception as exc:
+        raise UnDirectedGraphException(f"Encountered problems when reading from the file! Operation Aborted! {exc}")
+
+
+# LABEL PROPAGATION ALGORITHM ( NUMPY )
+def label_propagation_labels(vertices_count: int, sources, targets):
+    """
+    Returns the NumPy array of the component labels of the dense ids 0...vertices_count-1, the label of a vertex
+    being the smallest dense id of its component, computed with whole-array passes only ( Shiloach-Vishkin style ):
+    - hooking: every label moves to the smallest label across its edges
+    - pointer jumping: labels[v] = labels[labels[v]] until nothing changes, so every label is a root again
+    until no edge joins two different labels ( O(log V) rounds in practice )
+    Raises UnDirectedGraphException if NumPy is not installed
+
+    :param vertices_count: The number of vertices
+    :param sources: The array ( or buffer of int64 ) of the dense ids of the edge sources
+    :param targets: The array ( or buffer of int64 ) of the dense ids of the edge targets, parallel to sources
+    """
+    if numpy is None:
+        raise UnDirectedGraphException("The label propagation components need NumPy, which is not installed")
+
+    sources = numpy.asarray(sources, dtype=numpy.int64)
+    targets = numpy.asarray(targets, dtype=numpy.int64)
+    labels = numpy.arange(vertices_count, dtype=numpy.int64)
+
+    while True:
+        source_labels = labels[sources]
+        target_labels = labels[targets]
+        crossing = source_labels != target_labels
+        if not crossing.any():
+            return labels
+
+        # Hooking both ways, so the edges may be given in a single direction
+        source_labels = source_labels[crossing]
+        target_labels = target_labels[crossing]
+        numpy.minimum.at(labels, source_labels, target_labels)
+        numpy.minimum.at(labels, target_labels, source_labels)
+
+        # Pointer jumping
+        while True:
+            jumped = labels[labels]
+            if numpy.array_equal(jumped, labels):
+                break
+            labels = jumped
+
+
+def label_propagation_components(graph):
+    """
+    Returns the list of all connected components inside an UnDirectedGraph, as connected_components() with
+    UNION_FIND does ( same components, in the same order ), labelling them with label_propagation_labels() over
+    the CSR arrays of graph.freeze()
+    Raises UnDirectedGraphException if NumPy is not installed
+
+    :param graph: The given Graph ( or Frozen Graph )
+    """
+    if numpy is None:
+        raise UnDirectedGraphException("The label propagation components need NumPy, which is not installed")
+
+    frozen = graph.freeze()
+    n = frozen.vertices_count()
+    offsets = numpy.asarray(frozen.offsets, dtype=numpy.int64)
+    sources = numpy.repeat(numpy.arange(n, dtype=numpy.int64), numpy.diff(offsets))
+    labels = label_propagation_labels(n, sources, frozen.targets)
+
+    # Grouping the vertices by label: the labels are the first dense ids of the components, so sorting them
+    # ( stably ) gives the components in order, each one keeping the order of the vertices
+    order = numpy.argsort(labels, kind='stable')
+    starts = numpy.flatnonzero(numpy.diff(labels[order], prepend=-1))
+    numbers = numpy.asarray(frozen.vertex_numbers)[order].tolist()
+    bounds = starts.tolist() + [n]
+    return [numbers[bounds[i]:bounds[i + 1]] for i in range(len(starts))]
 
 
 # CONNECTED COMPONENTS GETTER
-def connected_components(graph: UnDirectedGraph):
+def connected_components(graph: UnDirectedGraph, algorithm: str = None):
     """
     Returns the list of all connected components inside an UnDirectedGraph
+    With DEPTH_FIRST each component lists its vertices in depth-first order, with UNION_FIND or LABEL_PROPAGATION
+    ( NumPy only ) in the order of the vertices of the graph; all give the components in the order of their first vertex
+    By default, a graph tracking its components answers from its own cache ( see UnDirectedGraph.components() ),
+    any other graph uses DEPTH_FIRST
+
     :param graph: The given Graph
+    :param algorithm: The engine to use, DEPTH_FIRST, UNION_FIND or LABEL_PROPAGATION, None to pick it as above
     """
+    if algorithm is None:
+        if graph.tracks_components():
+            return [list(component) for component in graph.components()]
+        algorithm = DEPTH_FIRST
+
+    if algorithm == UNION_FIND:
+        vertices = [vertex.number for vertex in graph.vertices()]
+        return union_find_components(graph.weighted_edges(), vertices)
+    if algorithm == LABEL_PROPAGATION:
+        return label_propagation_components(graph)
+    if algorithm != DEPTH_FIRST:
+        raise UnDirectedGraphException(f"Unknown connected components algorithm: {algorithm}")
 
     # Set of visited vertices
     visited = set()
@@ -54,7 +201,7 @@ def connected_components(graph: UnDirectedGraph):
     while iterator.valid():
 
         vertex = iterator.getCurrent()
-        if vertex not in visited:
+        if vertex.number not in visited:
 
             # Getting all connected vertices
             component = []
@@ -4,34 +4,194 @@
 # --- Domain ---
 from Assignment_1.src.Domain.vertex import Vertex
 from Assignment_1.src.Domain.edge import Edge
-from Assignment_1.src.Domain.directed_graph import DirectedGraph, DirectedGraphException
-from Assignment_1.src.Domain.undirected_graph import UnDirectedGraph, UnDirectedGraphException
+from Assignment_1.src.Domain.directed_graph import DirectedGraph, FrozenDirectedGraph, DirectedGraphException
+from Assignment_1.src.Domain.undirected_graph import UnDirectedGraph, FrozenUnDirectedGraph, UnDirectedGraphException
+# --- Misc ---
+import os
+import sys
+import bz2
+import gzip
+import lzma
+import mmap
+import time
+from array import array
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Definition Section
+# Size of the blocks read at once from a graph file, and the minimum time between two progress reports ( seconds )
+CHUNK_SIZE = 1 << 22
+PROGRESS_INTERVAL = 0.25
+# Number of edge lines written to a graph file at once
+WRITE_BATCH = 1 << 16
+# Binary graph format: magic bytes, then a header of int64 values ( byte order mark, directed flag, vertices count,
+# edges count, adjacency entries count, uncosted edges count ), followed by the int64 CSR sections
+BINARY_MAGIC = b"GRAPHCSR"
+BINARY_BYTE_ORDER = 0x0102030405060708
+BINARY_HEADER_FIELDS = 6
+# Compressed graph files: codecs recognised by the magic bytes at the start of a file, or by the file suffix
+COMPRESSION_MAGIC = {b"\x1f\x8b": gzip, b"BZh": bz2, b"\xfd7zXZ\x00": lzma}
+COMPRESSION_SUFFIXES = {".gz": gzip, ".bz2": bz2, ".xz": lzma}
+
+
+# COMPRESSED FILES DETECTION
+def compression_codec(file_path, detect_magic: bool = True):
+    """
+    Returns the stdlib codec module ( gzip, bz2 or lzma ) of the compressed file at file_path, None for a plain file
+    The magic bytes of an existing file decide first, the suffix of the file path is used otherwise
+
+    :param file_path: The file path of the file to check
+    :param detect_magic: Whether to look at the magic bytes of the file ( False for files about to be written )
+    """
+    if detect_magic and os.path.isfile(file_path):
+        with open(file_path, 'rb') as file:
+            head = file.read(max(len(magic) for magic in COMPRESSION_MAGIC))
+        for (magic, codec) in COMPRESSION_MAGIC.items():
+            if head.startswith(magic):
+                return codec
+        return None
+
+    return COMPRESSION_SUFFIXES.get(os.path.splitext(str(file_path))[1].lower())
+
+
+# EDGE LIST PARSING IMPLEMENTATION
+def parse_edges(buffer: bytes):
+    """
+    Parses a block of complete "source target cost" lines and returns the parallel (sources, targets, costs) arrays
+    Raises ValueError if the block does not hold a whole number of edges
+
+    :param buffer: The bytes of the lines to parse
+    """
+    numbers = array('q', map(int, buffer.split()))
+    if len(numbers) % 3 != 0:
+        raise ValueError("Every edge line must contain a source, a target and a cost")
+
+    return numbers[0::3], numbers[1::3], numbers[2::3]
+
+
+def read_edge_chunks(file, chunk_size: int = CHUNK_SIZE, limit: int = None):
+    """
+    Reads a binary file object in blocks of about chunk_size bytes, cut at line boundaries, and yields them
+    Each yielded block contains only complete lines
+
+    :param file: The binary file object to read from
+    :param chunk_size: The number of bytes to read at once
+    :param limit: Optional number of bytes after which to stop reading
+    """
+    remainder = b""
+    while limit is None or limit > 0:
+        chunk = file.read(chunk_size if limit is None else min(chunk_size, limit))
+        if not chunk:
+            break
+        if limit is not None:
+            limit -= len(chunk)
+
+        chunk = remainder + chunk
+        cut = chunk.rfind(b"\n") + 1
+        remainder = chunk[cut:]
+        if cut:
+            yield chunk[:cut]
+
+    if remainder.strip():
+        yield remainder
+
+
+def parse_edge_range(file_path, start: int, end: int):
+    """
+    Parses the lines found between the byte offsets start and end of the file at file_path
+    Returns the parallel (sources, targets, costs) arrays, in the order of the lines
+    ( Runs inside the worker processes of the parallel read_graph, so it only receives picklable arguments )
+
+    :param file_path: The file path of the file to read from
+    :param start: The offset of the first byte of the range ( the beginning of a line )
+    :param end: The offset after the last byte of the range ( the beginning of a line, or the end of the file )
+    """
+    sources, targets, costs = array('q'), array('q'), array('q')
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        for chunk in read_edge_chunks(file, limit=end - start):
+            chunk_sources, chunk_targets, chunk_costs = parse_edges(chunk)
+            sources.extend(chunk_sources)
+            targets.extend(chunk_targets)
+            costs.extend(chunk_costs)
+
+    return sources, targets, costs
+
+
+def split_edge_ranges(file_path, start: int, parts: int):
+    """
+    Splits the file at file_path, from the byte offset start to its end, into at most parts byte ranges
+    Every range begins at the beginning of a line, and returns the list of (start, end) offsets
+
+    :param file_path: The file path of the file to split
+    :param start: The offset where the first range begins
+    :param parts: The wanted number of ranges
+    """
+    total_bytes = os.path.getsize(file_path)
+    bounds = [start]
+    with open(file_path, 'rb') as file:
+        for part in range(1, parts):
+            file.seek(max(bounds[-1], start + (total_bytes - start) * part // parts))
+            file.readline()
+            bound = file.tell()
+            if bound >= total_bytes:
+                break
+            if bound > bounds[-1]:
+                bounds.append(bound)
+    bounds.append(total_bytes)
+
+    return [(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1) if bounds[i] < bounds[i + 1]]
 
 
 # FILE READING OPERATION IMPLEMENTATION
-def read_graph(graph, file_path):
+def read_graph(graph, file_path, progress=None, workers: int = None):
     """
     Adds to the specified Graph the data ( vertices, edges and costs ) read from the file at file_path
     Raises Exception for an invalid file_path or any other file reading related issues
 
+    The file is read in large blocks which are parsed to integer arrays and added through the bulk edge insertion
+    If given, progress( bytes_read, total_bytes ) is called at most once every PROGRESS_INTERVAL seconds, and at the end
+    With workers > 1, the file is split into byte ranges aligned to lines, parsed in a pool of worker processes,
+    and the ranges are added in file order ( so the result is identical to the serial read )
+    Files compressed with gzip, bzip2 or xz are decompressed on the fly ( and always parsed serially )
+
     :param graph: The Graph to append data to
     :param file_path: The file path of the file to read from
+    :param progress: Optional callback reporting the reading progress
+    :param workers: Optional number of worker processes used for parsing
     """
     try:
-        with open(file_path, 'r') as file:
-            file.readline()
-            k = 0
-            for line in file.readlines():
-                print(k)
-                k += 1
-                source, target, cost = map(int, line.strip().split())
-                graph.add_edge(source, target)
-                graph.modify_cost(source, target, cost)
+        total_bytes = os.path.getsize(file_path)
+        codec = compression_codec(file_path)
+        with open(file_path, 'rb') as raw, codec.open(raw, 'rb') if codec else nullcontext(raw) as file:
+            header = file.readline()
+            last_report = time.monotonic()
+
+            parallel = workers is not None and workers > 1 and codec is None
+            with ProcessPoolExecutor(max_workers=workers) if parallel else nullcontext() as executor:
+                if parallel:
+                    ranges = split_edge_ranges(file_path, len(header), workers)
+                    parsed = executor.map(parse_edge_range, [file_path] * len(ranges),
+                                          [start for (start, end) in ranges], [end for (start, end) in ranges])
+                    blocks = zip((end for (start, end) in ranges), parsed)
+                else:
+                    blocks = ((raw.tell(), parse_edges(chunk)) for chunk in read_edge_chunks(file))
+
+                for (bytes_read, (sources, targets, costs)) in blocks:
+                    graph.add_edges_from(sources, targets, costs)
+
+                    if progress is not None and time.monotonic() - last_report >= PROGRESS_INTERVAL:
+                        last_report = time.monotonic()
+                        progress(bytes_read, total_bytes)
+
+            if progress is not None:
+                progress(total_bytes, total_bytes)
 
     except Exception as exc:
-        if isinstance(graph, DirectedGraph):
+        if isinstance(graph, (DirectedGraph, FrozenDirectedGraph)):
             raise DirectedGraphException(f"Encountered problems when reading from the file! Operation Aborted! {exc}")
-        elif isinstance(graph, UnDirectedGraph):
+        elif isinstance(graph, (UnDirectedGraph, FrozenUnDirectedGraph)):
             raise UnDirectedGraphException(f"Encountered problems when reading from the file! Operation Aborted! {exc}")
 
 
@@ -41,57 +201,142 @@ def save_graph(graph, file_path):
     Saves in the file at the specified file_path the data of the Graph ( vertices, edges and costs )
     Raises Exception for an invalid file_path or any other file writing related issues
 
+    The edges are streamed to the file in batches of WRITE_BATCH lines, so the memory used stays constant
+    Edges without a cost are saved with a cost of 0, undirected edges are saved once, from their smaller end
+    A file_path ending in .gz, .bz2 or .xz is compressed on the fly with the matching codec
+
     :param graph: The Graph to save data from
     :param file_path: The file path of the file to save to
     """
     try:
-        with open(file_path, 'w') as file:
-            content = ""
-            content += f"{graph.vertices_count()} {graph.edges_count()}\n"
-
-            # Keeping track of the visited edges to avoid duplicates
-            visited_edges = set()
-
-            vertex_iterator = graph.vertex_iterator()
-            while vertex_iterator.valid():
-                vertex = vertex_iterator.getCurrent()
-
-                if isinstance(graph, DirectedGraph):
-                    # Printing for each vertex only one set of edges ( Inbound / Outbound ) to avoid duplicates
-                    # Inbound Edges
-                    inbound_iterator = graph.inbound_iterator(vertex.number)
-                    while inbound_iterator.valid():
-                        edge = inbound_iterator.getCurrent()
-                        content += f"{edge.source.number} {edge.target.number} {graph.get_cost(edge.source.number, edge.target.number)}\n"
-                        inbound_iterator.next()
-                elif isinstance(graph, UnDirectedGraph):
-                    # Printing for each vertex the set of edges
-
-                    iterator = graph.edges_iterator(vertex.number)
-                    while iterator.valid():
-                        edge = iterator.getCurrent()
-                        cost = graph.get_cost(edge.source.number, edge.target.number)
-                        if cost is None:
-                            cost = 0
-
-                        # Convert Edge objects to tuples for comparison
-                        edge_tuple = (edge.source.number, edge.target.number)
-                        reverse_edge_tuple = (edge.target.number, edge.source.number)
-
-                        # Check if the edge or its reverse has already been visited
-                        if (edge_tuple not in visited_edges) and (reverse_edge_tuple not in visited_edges):
-                            visited_edges.add(edge_tuple)
-                            content += f"{edge.source.number} {edge.target.number} {cost}\n"
-
-                        iterator.next()
-
-                # Getting the next vertex
-                vertex_iterator.next()
-
-            file.write(content)
+        codec = compression_codec(file_path, detect_magic=False)
+        with codec.open(file_path, 'wt') if codec else open(file_path, 'w', buffering=CHUNK_SIZE) as file:
+            file.write(f"{graph.vertices_count()} {graph.edges_count()}\n")
+
+            batch = []
+            for (source, target, cost) in graph.weighted_edges():
+                batch.append(f"{source} {target} {0 if cost is None else cost}\n")
+                if len(batch) >= WRITE_BATCH:
+                    file.writelines(batch)
+                    batch.clear()
+            file.writelines(batch)
+
+    except Exception as exc:
+        if isinstance(graph, (DirectedGraph, FrozenDirectedGraph)):
+            raise DirectedGraphException(f"Encountered problems when writing to the file! Operation Aborted! {exc}")
+        elif isinstance(graph, (UnDirectedGraph, FrozenUnDirectedGraph)):
+            raise UnDirectedGraphException(f"Encountered problems when writing to the file! Operation Aborted! {exc}")
+
+
+# BINARY FILE SAVING OPERATION IMPLEMENTATION
+def save_graph_binary(graph, file_path):
+    """
+    Saves in the file at the specified file_path the Graph in the binary CSR format ( see BINARY_MAGIC )
+    The sections are, in order: vertex numbers, offsets, targets, costs, ( for directed graphs: inbound offsets,
+    inbound sources, inbound costs ), then the flattened (id, id) pairs of the edges without a cost
+    Raises Exception for an invalid file_path or any other file writing related issues
+
+    :param graph: The Graph ( or Frozen Graph ) to save data from
+    :param file_path: The file path of the file to save to
+    """
+    try:
+        frozen = graph.freeze()
+        directed = isinstance(frozen, FrozenDirectedGraph)
+
+        if directed:
+            sections = [frozen.out_offsets, frozen.out_targets, frozen.out_costs,
+                        frozen.in_offsets, frozen.in_sources, frozen.in_costs]
+            entries = len(frozen.out_targets)
+        else:
+            sections = [frozen.offsets, frozen.targets, frozen.costs]
+            entries = len(frozen.targets)
+
+        uncosted = array('q')
+        for pair in sorted(frozen.uncosted_edges):
+            uncosted.extend(pair)
+
+        header = array('q', [BINARY_BYTE_ORDER, int(directed), frozen.vertices_count(), frozen.edges_count(),
+                             entries, len(frozen.uncosted_edges)])
+
+        with open(file_path, 'wb') as file:
+            file.write(BINARY_MAGIC)
+            header.tofile(file)
+            array('q', frozen.vertex_numbers).tofile(file)
+            for section in sections:
+                array('q', section).tofile(file)
+            uncosted.tofile(file)
 
     except Exception as exc:
-        if isinstance(graph, DirectedGraph):
+        if isinstance(graph, (DirectedGraph, FrozenDirectedGraph)):
             raise DirectedGraphException(f"Encountered problems when writing to the file! Operation Aborted! {exc}")
-        elif isinstance(graph, UnDirectedGraph):
+        elif isinstance(graph, (UnDirectedGraph, FrozenUnDirectedGraph)):
             raise UnDirectedGraphException(f"Encountered problems when writing to the file! Operation Aborted! {exc}")
+
+
+# BINARY FILE READING OPERATION IMPLEMENTATION
+def load_graph_binary(file_path):
+    """
+    Returns the Frozen Graph ( FrozenDirectedGraph or FrozenUnDirectedGraph ) saved in the binary file at file_path
+    The file is memory-mapped read-only, so the CSR arrays are views over the file pages and are not copied
+    ( Loading is close to instant and processes opening the same file share its pages )
+    Raises Exception for an invalid file_path, an invalid file, or any other file reading related issues
+
+    :param file_path: The file path of the file to read from
+    """
+    directed = True
+    try:
+        with open(file_path, 'rb') as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if mapping[:len(BINARY_MAGIC)] != BINARY_MAGIC:
+            raise ValueError("Not a binary graph file")
+
+        view = memoryview(mapping)[len(BINARY_MAGIC):].cast('q')
+        byte_order, directed, vertices, edges, entries, uncosted = view[:BINARY_HEADER_FIELDS].tolist()
+        if byte_order != BINARY_BYTE_ORDER:
+            raise ValueError(f"The file was saved with a byte order different from the {sys.byteorder}-endian one")
+
+        # Cutting the int64 view into its sections
+        sizes = [vertices, vertices + 1, entries, entries]
+        if directed:
+            sizes += [vertices + 1, entries, entries]
+        sizes.append(2 * uncosted)
+
+        sections = []
+        position = BINARY_HEADER_FIELDS
+        for size in sizes:
+            if position + size > len(view):
+                raise ValueError("The binary graph file is truncated")
+            sections.append(view[position:position + size])
+            position += size
+
+        vertex_numbers = sections[0].tolist()
+        uncosted_pairs = sections[-1].tolist()
+        uncosted_edges = set(zip(uncosted_pairs[0::2], uncosted_pairs[1::2]))
+
+        if directed:
+            return FrozenDirectedGraph(vertex_numbers, *sections[1:7], uncosted_edges)
+        return FrozenUnDirectedGraph(vertex_numbers, *sections[1:4], uncosted_edges, edges)
+
+    except Exception as exc:
+        if directed:
+            raise DirectedGraphException(f"Encountered problems when reading from the file! Operation Aborted! {exc}")
+        raise UnDirectedGraphException(f"Encountered problems when reading from the file! Operation Aborted! {exc}")
+
+
+# TEXT TO BINARY FILE CONVERSION IMPLEMENTATION
+def convert_graph_to_binary(text_file_path, binary_file_path, directed: bool = True):
+    """
+    Reads the text edge list at text_file_path and saves it in the binary format at binary_file_path
+    Returns the number of edges converted
+    Raises Exception for invalid file paths or any other file related issues
+
+    :param text_file_path: The file path of the text file to read from
+    :param binary_file_path: The file path of the binary file to save to
+    :param directed: Whether the edges are read as a DirectedGraph or as an UnDirectedGraph
+    """
+    graph = DirectedGraph() if directed else UnDirectedGraph()
+    read_graph(graph, text_file_path)
+    save_graph_binary(graph, binary_file_path)
+
+    return graph.edges_count()
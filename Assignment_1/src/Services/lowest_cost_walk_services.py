@@ -8,67 +8,462 @@
 #
 
 # Includes Section
+import heapq
+from collections import deque
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
 from Assignment_1.src.Domain.vertex import Vertex
 from Assignment_1.src.Domain.edge import Edge, UEdge
 from Assignment_1.src.Domain.directed_graph import (DirectedGraph, DirectedGraphVertexIterator,
                                                       DirectedGraphInboundIterator, DirectedGraphOutboundIterator, DirectedGraphException)
+from Assignment_1.src.Services.strongly_connected_component_services import strongly_connected_component_ids
 
 
 # Definition Section
 # Define a constant for infinity (representing unreachable nodes)
 INF = 10000000000
 
+# Engines able to compute the lowest cost walks from a source vertex
+BELLMAN_FORD = "bellman-ford"
+SPFA = "spfa"
+COMPONENT_BELLMAN_FORD = "component-bellman-ford"
+DIJKSTRA = "dijkstra"
+DAG = "dag"
 
-# Implementation of the Algorithm
-def get_minpath(graph: DirectedGraph, source: Vertex, target: Vertex):
-
-    # Initialize the matrix to store the minimum cost walks
-    verticesCount = graph.vertices_count()
-
-    # Initializing the matrix
-    d = {}
-    for vertex in graph.vertices():
-        d[vertex] = ([INF for _ in range(0, verticesCount)])
-
-    # Only the source is accessible with a path length of 0 and a cost of 0
-    d[source][0] = 0
-
-    # Keeping track of the parents tree
-    parent = {}
-
-    # Filling in the matrix by relaxing the edges verticesCount - 1 times
-    for k in range(0, verticesCount):
-        for vertex in graph.vertices():
-            for neighbor_edge in graph.outbound_edges(vertex.number):
-                neighbor = neighbor_edge.target
-                cost = graph.get_cost(vertex.number, neighbor.number)
-                if d[vertex][k - 1] + cost < d[neighbor][k]:
-                    d[neighbor][k] = d[vertex][k - 1] + cost
-                    parent[neighbor] = vertex
-
-    # Check for negative cycles
-    # If we have another edge that can be reduced, we are dealing with a negative cycle
-    for vertex in graph.vertices():
-        for neighbor_edge in graph.outbound_edges(vertex.number):
-            neighbor = neighbor_edge.target
-            cost = graph.get_cost(vertex.number, neighbor.number)
-            if d[vertex][verticesCount-1] + cost < d[neighbor][verticesCount-2]:
-                raise DirectedGraphException("Negative cost cycle detected!")
-
-    # Rebuilding the minimum cost path and final cost
-    path = [target]
-    cost = 0
-    while target != source:
+# NOTE:
+# Only the last row of the d[x,k] matrix is ever needed to get the next one, so the engines keep a single row
+# ( the distances array ) and a parents array, both of size O(V), indexed by the dense ids of graph.freeze()
+# Edges without a cost are walked with a cost of 0
+# Every engine takes an optional target, after which it may stop early ( the other distances may then be unfinished )
+
+
+# BELLMAN-FORD ENGINE
+def bellman_ford(graph, source: int, target: int = None):
+    """
+    Returns the (distances, parents) arrays of the lowest cost walks from the source vertex, indexed by dense ids
+    Relaxes all edges at most V-1 times, stopping early after a pass which changes nothing
+    Raises DirectedGraphException if a negative cost cycle is reachable from the source
+
+    :param graph: The Frozen Directed Graph to walk
+    :param source: The dense id of the source vertex
+    :param target: The dense id of the target vertex ( unused, every pass walks all edges )
+    """
+    n = graph.vertices_count()
+    offsets, targets, costs = graph.out_offsets, graph.out_targets, graph.out_costs
+
+    distances = [INF] * n
+    parents = [-1] * n
+    distances[source] = 0
+
+    for _ in range(n):
+        changed = False
+        for vertex in range(n):
+            distance = distances[vertex]
+            if distance == INF:
+                continue
+            for position in range(offsets[vertex], offsets[vertex + 1]):
+                neighbour = targets[position]
+                new_distance = distance + costs[position]
+                if new_distance < distances[neighbour]:
+                    distances[neighbour] = new_distance
+                    parents[neighbour] = vertex
+                    changed = True
+
+        if not changed:
+            return distances, parents
+
+    # Still improving after V passes: the walks can be shortened forever
+    raise DirectedGraphException("Negative cost cycle detected!")
+
+
+# BELLMAN-FORD BY STRONGLY CONNECTED COMPONENTS ENGINE
+def component_bellman_ford(graph, source: int, target: int = None):
+    """
+    Returns the (distances, parents) arrays of the lowest cost walks from the source vertex, indexed by dense ids
+    Walks the strongly connected components in topological order: the edges inside a component C are relaxed at
+    most |C| times ( a walk leaving C never comes back, and a cycle never leaves its component ), then the edges
+    leaving C once, so the work is the sum of |C| * E(C) instead of V * E
+    Raises DirectedGraphException if a negative cost cycle is reachable from the source
+    ( Detected when the edges of a component still improve a distance after |C| passes )
+
+    :param graph: The Frozen Directed Graph to walk
+    :param source: The dense id of the source vertex
+    :param target: The dense id of the target vertex ( unused, a later negative cycle must still be detected )
+    """
+    n = graph.vertices_count()
+    offsets, targets, costs = graph.out_offsets, graph.out_targets, graph.out_costs
+
+    components = strongly_connected_component_ids(graph)
+    component_of = [0] * n
+    for (label, component) in enumerate(components):
+        for vertex in component:
+            component_of[vertex] = label
+
+    distances = [INF] * n
+    parents = [-1] * n
+    distances[source] = 0
+
+    for (label, component) in enumerate(components):
+        if all(distances[vertex] == INF for vertex in component):
+            continue
+
+        # Relaxing the edges inside the component
+        for _ in range(len(component)):
+            changed = False
+            for vertex in component:
+                distance = distances[vertex]
+                if distance == INF:
+                    continue
+                for position in range(offsets[vertex], offsets[vertex + 1]):
+                    neighbour = targets[position]
+                    new_distance = distance + costs[position]
+                    if component_of[neighbour] == label and new_distance < distances[neighbour]:
+                        distances[neighbour] = new_distance
+                        parents[neighbour] = vertex
+                        changed = True
+
+            if not changed:
+                break
+        else:
+            # Still improving after |C| passes: the walks can be shortened forever
+            raise DirectedGraphException("Negative cost cycle detected!")
+
+        # Relaxing the edges leaving the component, once and for all
+        for vertex in component:
+            distance = distances[vertex]
+            if distance == INF:
+                continue
+            for position in range(offsets[vertex], offsets[vertex + 1]):
+                neighbour = targets[position]
+                new_distance = distance + costs[position]
+                if component_of[neighbour] != label and new_distance < distances[neighbour]:
+                    distances[neighbour] = new_distance
+                    parents[neighbour] = vertex
+
+    return distances, parents
+
+
+# SPFA ( QUEUE BASED BELLMAN-FORD ) ENGINE
+def shortest_path_faster(graph, source: int, target: int = None):
+    """
+    Returns the (distances, parents) arrays of the lowest cost walks from the source vertex, indexed by dense ids
+    Only relaxes the edges of the vertices whose distance changed, kept in a FIFO queue
+    Raises DirectedGraphException if a negative cost cycle is reachable from the source
+    ( Detected when the walk of a vertex reaches V edges, a walk that long repeating a vertex on a negative cycle;
+    counting the relaxations instead would be wrong, a vertex being possibly lowered many times in the same round )
+
+    :param graph: The Frozen Directed Graph to walk
+    :param source: The dense id of the source vertex
+    :param target: The dense id of the target vertex ( unused, a negative cycle may still improve it )
+    """
+    n = graph.vertices_count()
+    offsets, targets, costs = graph.out_offsets, graph.out_targets, graph.out_costs
+
+    distances = [INF] * n
+    parents = [-1] * n
+    lengths = [0] * n
+    queued = [False] * n
+    distances[source] = 0
+
+    queue = deque([source])
+    queued[source] = True
+    while queue:
+        vertex = queue.popleft()
+        queued[vertex] = False
+
+        distance = distances[vertex]
+        for position in range(offsets[vertex], offsets[vertex + 1]):
+            neighbour = targets[position]
+            new_distance = distance + costs[position]
+            if new_distance < distances[neighbour]:
+                distances[neighbour] = new_distance
+                parents[neighbour] = vertex
+
+                lengths[neighbour] = lengths[vertex] + 1
+                if lengths[neighbour] >= n:
+                    raise DirectedGraphException("Negative cost cycle detected!")
+
+                if not queued[neighbour]:
+                    queued[neighbour] = True
+                    queue.append(neighbour)
+
+    return distances, parents
+
+
+# DIJKSTRA ENGINE ( NON-NEGATIVE COSTS ONLY )
+def dijkstra(graph, source: int, target: int = None):
+    """
+    Returns the (distances, parents) arrays of the lowest cost walks from the source vertex, indexed by dense ids
+    Settles the vertices in increasing distance order using a binary heap, and stops once the target is settled
+    Only correct when no edge has a negative cost
+
+    :param graph: The Frozen Directed Graph to walk
+    :param source: The dense id of the source vertex
+    :param target: The dense id of the target vertex, None to settle every accessible vertex
+    """
+    n = graph.vertices_count()
+    offsets, targets, costs = graph.out_offsets, graph.out_targets, graph.out_costs
+
+    distances = [INF] * n
+    parents = [-1] * n
+    settled = [False] * n
+    distances[source] = 0
+
+    heap = [(0, source)]
+    while heap:
+        distance, vertex = heapq.heappop(heap)
+        if settled[vertex]:
+            continue
+        settled[vertex] = True
+        if vertex == target:
+            break
+
+        for position in range(offsets[vertex], offsets[vertex + 1]):
+            neighbour = targets[position]
+            new_distance = distance + costs[position]
+            if new_distance < distances[neighbour]:
+                distances[neighbour] = new_distance
+                parents[neighbour] = vertex
+                heapq.heappush(heap, (new_distance, neighbour))
+
+    return distances, parents
+
+
+# DIRECTED ACYCLIC GRAPH ENGINE
+def dag_shortest_path(graph, source: int, target: int = None):
+    """
+    Returns the (distances, parents) arrays of the lowest cost walks from the source vertex, indexed by dense ids
+    Relaxes the outbound edges of every vertex once, in topological order, so negative costs are allowed and the
+    work is O(V+E); stops once the target is reached, its distance being final then
+    Raises DirectedGraphException if the graph has a cycle
+
+    :param graph: The Frozen Directed Graph to walk ( its topological_order() is computed once and kept )
+    :param source: The dense id of the source vertex
+    :param target: The dense id of the target vertex, None to finish every accessible vertex
+    """
+    order = graph.topological_order()
+    if order is None:
+        raise DirectedGraphException("The DAG engine cannot be used on a graph having cycles!")
+
+    n = graph.vertices_count()
+    offsets, targets, costs = graph.out_offsets, graph.out_targets, graph.out_costs
+
+    distances = [INF] * n
+    parents = [-1] * n
+    distances[source] = 0
+
+    # The vertices before the source in the order cannot be reached from it
+    for vertex in order[order.index(source):]:
+        if vertex == target:
+            break
+        distance = distances[vertex]
+        if distance == INF:
+            continue
+        for position in range(offsets[vertex], offsets[vertex + 1]):
+            neighbour = targets[position]
+            new_distance = distance + costs[position]
+            if new_distance < distances[neighbour]:
+                distances[neighbour] = new_distance
+                parents[neighbour] = vertex
 
-        # Getting the cost from source to target
-        cost += graph.get_cost(parent[target].number, target.number)
+    return distances, parents
 
-        # Getting the parent of the vertex
-        target = parent[target]
 
-        # Appending the new vertex
-        path.append(target)
+# Engines by name
+ENGINES = {BELLMAN_FORD: bellman_ford, COMPONENT_BELLMAN_FORD: component_bellman_ford, SPFA: shortest_path_faster,
+           DIJKSTRA: dijkstra, DAG: dag_shortest_path}
+
+
+# ENGINE SELECTION
+def choose_algorithm(graph):
+    """
+    Returns the name of the engine used by default for the lowest cost walks on the given graph, when it has cycles
+    ( DIJKSTRA when no edge has a negative cost, COMPONENT_BELLMAN_FORD otherwise; an acyclic graph gets DAG from
+    lowest_cost_walk() before this is asked )
+
+    :param graph: The Directed Graph ( or Frozen Directed Graph ) to search
+    """
+    if graph.has_negative_costs():
+        return COMPONENT_BELLMAN_FORD
+    return DIJKSTRA
+
+
+def select_engine(graph, frozen, algorithm: str = None):
+    """
+    Returns the name of the engine answering the lowest cost walks on the given graph
+    Without an algorithm, DAG is used if the graph has no cycles, choose_algorithm() picks the engine otherwise
+    ( The acyclicity is read from the topological_order() the frozen graph keeps, and a DirectedGraph keeps its
+    frozen graph until its next modification, so repeated queries only pay for it once )
+    Raises DirectedGraphException for an unknown algorithm, or for DIJKSTRA on a graph having negative costs
+
+    :param graph: The Directed Graph ( or Frozen Directed Graph ) to search
+    :param frozen: The graph.freeze() Frozen Directed Graph
+    :param algorithm: The engine to use ( see ENGINES ), None to pick it as above
+    """
+    if algorithm is None:
+        algorithm = DAG if frozen.topological_order() is not None else choose_algorithm(graph)
+    if algorithm not in ENGINES:
+        raise DirectedGraphException(f"Unknown lowest cost walk algorithm: {algorithm}")
+    if algorithm == DIJKSTRA and graph.has_negative_costs():
+        raise DirectedGraphException("Dijkstra cannot be used on a graph having negative costs!")
+    return algorithm
+
+
+def rebuild_path(parents, source: int, target: int):
+    """
+    Returns the list of the dense ids of the walk from source to target, following the parents array back from target
+
+    :param parents: The parents array given by an engine
+    :param source: The dense id of the source vertex
+    :param target: The dense id of the target vertex ( accessible from the source )
+    """
+    path = [target]
+    while path[-1] != source:
+        path.append(parents[path[-1]])
 
     # Reversing the list to get the source -> target order in place
     path.reverse()
+    return path
+
+
+# Implementation of the Algorithm
+def lowest_cost_walk(graph: DirectedGraph, source: Vertex, target: Vertex, algorithm: str = None):
+    """
+    Returns the (path, cost, algorithm) of a lowest cost walk from source to target,
+    the path being a list of Vertices and algorithm the name of the engine which computed it
+    Raises DirectedGraphException if either vertex is not inside the graph, if the target is not reachable,
+    or if a negative cost cycle is reachable from the source
+
+    :param graph: The Directed Graph ( or Frozen Directed Graph ) to search
+    :param source: The Source Vertex
+    :param target: The Target Vertex
+    :param algorithm: The engine to use ( see ENGINES ), None to use DAG if the graph has no cycles,
+    or to let choose_algorithm() pick it otherwise
+    """
+    frozen = graph.freeze()
+    algorithm = select_engine(graph, frozen, algorithm)
+
+    # Getting the dense ids of the vertices
+    source_id = frozen.index_of(source.number)
+    target_id = frozen.index_of(target.number)
+    if source_id is None or target_id is None:
+        raise DirectedGraphException("Vertex not inside the DirectedGraph")
+
+    distances, parents = ENGINES[algorithm](frozen, source_id, target_id)
+    if distances[target_id] == INF:
+        raise DirectedGraphException("The target vertex is not accessible from the source vertex!")
+
+    path = rebuild_path(parents, source_id, target_id)
+    return [Vertex(frozen.vertex_numbers[vertex]) for vertex in path], distances[target_id], algorithm
+
+
+def get_minpath(graph: DirectedGraph, source: Vertex, target: Vertex, algorithm: str = None):
+    """
+    Returns the (path, cost) of a lowest cost walk from source to target, the path being a list of Vertices
+    Raises DirectedGraphException if either vertex is not inside the graph, if the target is not reachable,
+    or if a negative cost cycle is reachable from the source
+    ( Use lowest_cost_walk() to also get the name of the engine which answered )
+
+    :param graph: The Directed Graph ( or Frozen Directed Graph ) to search
+    :param source: The Source Vertex
+    :param target: The Target Vertex
+    :param algorithm: The engine to use ( see ENGINES ), None to pick it as lowest_cost_walk() does
+    """
+    path, cost, _ = lowest_cost_walk(graph, source, target, algorithm)
     return path, cost
+
+
+# BATCH QUERIES
+def shortest_path_tree_walks(graph, algorithm: str, source: int, targets):
+    """
+    Returns the list of the ( path, cost ) of the lowest cost walks from source to every target, the paths being lists
+    of dense ids, None for a target not accessible from the source; the whole shortest path tree of the source is
+    computed once and every target is read from it
+    Raises DirectedGraphException if a negative cost cycle is reachable from the source
+
+    :param graph: The Frozen Directed Graph to walk
+    :param algorithm: The engine to use ( see ENGINES )
+    :param source: The dense id of the source vertex
+    :param targets: The dense ids of the target vertices
+    """
+    distances, parents = ENGINES[algorithm](graph, source)
+
+    return [(rebuild_path(parents, source, target), distances[target]) if distances[target] != INF else None
+            for target in targets]
+
+
+# Graph and engine of the current worker process of the batch queries ( set by walks_worker_init )
+walks_worker = {}
+
+
+def walks_worker_init(graph, algorithm):
+    """
+    Keeps, inside a worker process of the batch queries, the graph and engine every source is walked with
+
+    :param graph: The Frozen Directed Graph to walk
+    :param algorithm: The engine to use
+    """
+    walks_worker.update(graph=graph, algorithm=algorithm)
+
+
+def walks_worker_task(task):
+    """
+    Returns, from inside a worker process, the shortest_path_tree_walks() of a source
+
+    :param task: The ( source, targets ) tuple of the dense ids of the source and of its targets
+    """
+    source, targets = task
+    return shortest_path_tree_walks(walks_worker['graph'], walks_worker['algorithm'], source, targets)
+
+
+def lowest_cost_walks(graph: DirectedGraph, pairs, algorithm: str = None, workers: int = None):
+    """
+    Returns the ( walks, algorithm ) of the lowest cost walks for many ( source, target ) pairs of Vertices, walks
+    being the list of their ( path, cost ) in the order of the pairs ( None for a target not accessible from its
+    source ) and algorithm the name of the engine which computed them
+    The pairs are grouped by source, so every distinct source gets a single shortest path tree, all its targets
+    being answered from it ( the engine is picked once for the graph, like in lowest_cost_walk() )
+    Raises DirectedGraphException if any vertex is not inside the graph, or if a negative cost cycle is reachable
+    from a source
+
+    With workers > 1, the distinct sources are walked in a pool of worker processes
+
+    :param graph: The Directed Graph ( or Frozen Directed Graph ) to search
+    :param pairs: Iterable of ( source, target ) tuples of Vertices
+    :param algorithm: The engine to use ( see ENGINES ), None to pick it as lowest_cost_walk() does
+    :param workers: Optional number of worker processes
+    """
+    frozen = graph.freeze()
+    algorithm = select_engine(graph, frozen, algorithm)
+
+    # Grouping the targets by source, keeping the positions of the pairs to answer
+    targets_of = {}
+    positions_of = {}
+    pairs_count = 0
+    for (source, target) in pairs:
+        source_id = frozen.index_of(source.number)
+        target_id = frozen.index_of(target.number)
+        if source_id is None or target_id is None:
+            raise DirectedGraphException("Vertex not inside the DirectedGraph")
+        targets_of.setdefault(source_id, []).append(target_id)
+        positions_of.setdefault(source_id, []).append(pairs_count)
+        pairs_count += 1
+
+    tasks = list(targets_of.items())
+    parallel = workers is not None and workers > 1 and len(tasks) > 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=walks_worker_init,
+                             initargs=(frozen, algorithm)) if parallel else nullcontext() as executor:
+        if parallel:
+            results = executor.map(walks_worker_task, tasks, chunksize=max(1, len(tasks) // (4 * workers)))
+        else:
+            results = (shortest_path_tree_walks(frozen, algorithm, source, targets)
+                       for (source, targets) in tasks)
+
+        walks = [None] * pairs_count
+        numbers = frozen.vertex_numbers
+        for (source, source_walks) in zip(targets_of, results):
+            for (position, walk) in zip(positions_of[source], source_walks):
+                if walk is not None:
+                    walks[position] = ([Vertex(numbers[vertex]) for vertex in walk[0]], walk[1])
+
+    return walks, algorithm
@@ -5,90 +5,906 @@
 #
 
 # IMPORTS SECTION
+import time
+import random
+from array import array
 from itertools import combinations
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor
+try:
+    import numpy
+except ImportError:
+    numpy = None
 from Assignment_1.src.Domain.vertex import Vertex
 from Assignment_1.src.Domain.edge import Edge, UEdge
 from Assignment_1.src.Domain.directed_graph import (DirectedGraph, DirectedGraphVertexIterator,
                                                       DirectedGraphInboundIterator, DirectedGraphOutboundIterator, DirectedGraphException)
+from Assignment_1.src.Services.strongly_connected_component_services import strongly_connected_components
 
 
 # Definition Section
 # Define a constant for infinity (representing unreachable nodes)
 INF = 10000000000
+# Costs from this bound up are sums involving INF, so they stand for unreachable nodes too
+UNREACHABLE = INF // 2
+
+# Ways of building the first tour of the heuristic solver
+NEAREST_NEIGHBOUR = "nearest-neighbour"
+GREEDY_EDGE = "greedy-edge"
+# Largest graphs the heuristic solver hands to the exact travelling_salesman_problem ( Held-Karp takes well under a
+# second up to there )
+EXACT_VERTICES = 14
+# Longest chain of segment swaps the heuristic solver walks to move a missing edge of its tour where it can be replaced
+EJECTION_STEPS = 100
 
 # TSP - Travelling Salesman Problem
 # Given a list of cities and the distances between each pair of cities,
 # what is the shortest possible route that visits each city exactly once and returns to the origin city?
 
 # NOTE:
-# frozenset() is used instead of set, due to the ease of excluding elements from its set, and being immutable
+# The vertices other than the start get the positions 0...m-1, and a set of them is an integer mask ( bit j = position j )
+# The Held-Karp tables are flat arrays indexed by mask * m + j: the cost of the cheapest walk leaving the start,
+# visiting exactly the vertices of mask and ending in j, and the position of the vertex visited before j ( -1 = start )
+# The costs are read from a dense matrix, where a missing edge costs INF ( edges without a cost count as 0 )
+# A sum involving INF stays above UNREACHABLE ( as long as V * max|cost| is below INF / 2 ), so it is cut back to INF
+# The exact solvers first reject, in O(V+E), graphs which cannot have a Hamiltonian cycle, then contract the chains
+# of forced edges into single positions, every forced edge halving the 2^m tables
 
 
-# Solving the Traveling Salesman Problem
-def travelling_salesman_problem(graph: DirectedGraph, start_vertex: int):
+# DENSE COST MATRIX
+def cost_matrix(graph, vertices):
+    """
+    Returns the dense matrix of the edge costs between the given vertices, as a list of rows
+    matrix[i][j] is the cost of the edge vertices[i] -> vertices[j], INF if there is no such edge
+
+    :param graph: The Directed Graph ( or Frozen Directed Graph )
+    :param vertices: The list of the ID numbers of the vertices, giving the matrix positions
+    """
+    frozen = graph.freeze()
+    position = {number: index for (index, number) in enumerate(vertices)}
+    matrix = [[INF] * len(vertices) for _ in vertices]
+
+    for (index, number) in enumerate(vertices):
+        dense_id = frozen.index_of(number)
+        row = matrix[index]
+        for edge in range(frozen.out_offsets[dense_id], frozen.out_offsets[dense_id + 1]):
+            target = position.get(frozen.vertex_numbers[frozen.out_targets[edge]])
+            if target is not None:
+                row[target] = frozen.out_costs[edge]
+
+    return matrix
+
+
+# HELD-KARP INPUTS AND OUTPUTS
+def tsp_cost_matrix(graph, start_vertex: int):
+    """
+    Returns the (others, cost) Held-Karp inputs: the ID numbers of the vertices other than start_vertex
+    ( giving the positions 0...m-1 ), and the dense cost matrix where start_vertex gets the last position m
+    Raises DirectedGraphException if start_vertex is not inside the graph
+
+    :param graph: The Directed Graph ( or Frozen Directed Graph )
+    :param start_vertex: The ID number of the vertex the cycle starts from
+    """
+    if not graph.find_vertex(start_vertex):
+        raise DirectedGraphException("Vertex not inside the DirectedGraph")
+
+    others = [vertex.number for vertex in graph.vertices() if vertex.number != start_vertex]
+    return others, cost_matrix(graph, others + [start_vertex])
+
+
+def rebuild_cycle(start_vertex: int, others, parent_of, best_end: int):
+    """
+    Returns the Hamiltonian cycle [start_vertex, ..., start_vertex] ending its walk over all the others in best_end
+
+    :param start_vertex: The ID number of the vertex the cycle starts from
+    :param others: The ID numbers of the vertices at the positions 0...m-1
+    :param parent_of: Function giving for ( mask, j ) the position of the vertex before j, -1 for the start
+    :param best_end: The position of the last vertex visited before going back to start_vertex
+    """
+    path = [start_vertex]
+    mask = (1 << len(others)) - 1
+    while best_end != -1:
+        path.append(others[best_end])
+        previous = int(parent_of(mask, best_end))
+        mask ^= 1 << best_end
+        best_end = previous
+    path.append(start_vertex)
+    path.reverse()
+
+    return path
+
+
+# INFEASIBILITY PRE-CHECKS
+def hamiltonian_cycle_infeasibility(graph):
+    """
+    Returns the reason why the graph cannot have a Hamiltonian cycle, None if these O(V+E) checks find none
+    - the graph has less than 2 vertices
+    - some vertex has no inbound or no outbound edge
+    - the graph is not strongly connected ( more than one strongly_connected_components() )
+
+    :param graph: The Directed Graph ( or Frozen Directed Graph ) to check
+    """
+    if graph.vertices_count() < 2:
+        return "A Hamiltonian cycle needs at least 2 vertices"
+
+    for vertex in graph.vertices():
+        inbound, outbound = graph.degree(vertex.number)
+        if inbound == 0:
+            return f"Vertex {vertex.number} has no inbound edge"
+        if outbound == 0:
+            return f"Vertex {vertex.number} has no outbound edge"
+
+    components = strongly_connected_components(graph)
+    if len(components) > 1:
+        return f"The graph is not strongly connected: it has {len(components)} strongly connected components " \
+               f"( vertex {components[-1][0]} cannot reach vertex {components[0][0]} )"
+
+    return None
+
+
+# FORCED EDGES
+def contract_forced_edges(cost):
+    """
+    Returns the (chains, contracted cost, fixed cost) of the dense cost matrix after fixing its forced edges,
+    or None if they show that there is no Hamiltonian cycle
+    - an edge u -> w is forced when w is the only out-neighbour of u, or u the only in-neighbour of w,
+      so the other edges leaving u and entering w can be dropped ( which may force more edges )
+    - the forced edges make chains of positions, each one contracted into a single position of the new matrix:
+      contracted[a][b] is the cost of going from the last position of chain a to the first one of chain b,
+      and fixed cost is the sum of the costs inside the chains
+    The start ( last position ) begins the last chain, since edges entering it are never contracted
+
+    :param cost: The dense cost matrix, the start vertex having the last position
+    """
+    n = len(cost)
+    cost = [list(row) for row in cost]
+    out_sets = [{target for target in range(n) if target != source and cost[source][target] < UNREACHABLE}
+                for source in range(n)]
+    in_sets = [{source for source in range(n) if source != target and cost[source][target] < UNREACHABLE}
+               for target in range(n)]
+
+    def drop(source, target):
+        cost[source][target] = INF
+        out_sets[source].discard(target)
+        in_sets[target].discard(source)
+        pending.extend((source, target))
+
+    # Dropping the edges forced edges rule out, until nothing changes
+    pending = list(range(n))
+    while pending:
+        vertex = pending.pop()
+        if not out_sets[vertex] or not in_sets[vertex]:
+            return None
+        if len(out_sets[vertex]) == 1:
+            target = next(iter(out_sets[vertex]))
+            for source in [source for source in in_sets[target] if source != vertex]:
+                drop(source, target)
+        if len(in_sets[vertex]) == 1:
+            source = next(iter(in_sets[vertex]))
+            for target in [target for target in out_sets[source] if target != vertex]:
+                drop(source, target)
+
+    # Now a forced edge is the only edge leaving its source and the only one entering its target
+    start = n - 1
+    successor = [-1] * n
+    has_predecessor = [False] * n
+    for vertex in range(n):
+        if len(out_sets[vertex]) == 1:
+            target = next(iter(out_sets[vertex]))
+            if target != start:
+                successor[vertex] = target
+                has_predecessor[target] = True
+
+    # Following the chains from their heads, the start chain going last
+    heads = [vertex for vertex in range(n - 1) if not has_predecessor[vertex]] + [start]
+    chains = []
+    fixed_cost = 0
+    for head in heads:
+        chain = [head]
+        while successor[chain[-1]] != -1:
+            fixed_cost += cost[chain[-1]][successor[chain[-1]]]
+            chain.append(successor[chain[-1]])
+        chains.append(chain)
+
+    # Forced edges closing a cycle which misses some positions
+    if sum(len(chain) for chain in chains) < n:
+        return None
+
+    contracted = [[cost[chain[-1]][other[0]] for other in chains] for chain in chains]
+    return chains, contracted, fixed_cost
+
+
+def prepare_travelling_salesman_problem(graph, start_vertex: int):
+    """
+    Returns the (chains, cost, fixed cost) inputs shared by the exact solvers, None if there is no Hamiltonian cycle
+    ( chains are the ID numbers of the vertices contracted into each position of cost, see contract_forced_edges,
+    the last chain being the one which starts with start_vertex )
+    Raises DirectedGraphException if start_vertex is not inside the graph
+
+    :param graph: The Directed Graph ( or Frozen Directed Graph )
+    :param start_vertex: The ID number of the vertex the cycle starts from
+    """
+    if not graph.find_vertex(start_vertex):
+        raise DirectedGraphException("Vertex not inside the DirectedGraph")
+    if hamiltonian_cycle_infeasibility(graph) is not None:
+        return None
+
+    others, cost = tsp_cost_matrix(graph, start_vertex)
+    contraction = contract_forced_edges(cost)
+    if contraction is None:
+        return None
 
-    # Vertices
-    n = graph.vertices_count()
-    vertices = [vertex.number for vertex in graph.vertices()]
-    vertices = frozenset(vertices)
+    vertices = others + [start_vertex]
+    positions, contracted, fixed_cost = contraction
+    chains = [[vertices[position] for position in chain] for chain in positions]
+    return chains, contracted, fixed_cost
 
-    # Initialize g dictionary to store the minimum costs
-    g = {}
 
-    # Initialize parent dictionary to store the parents
-    parent = {}
+def expand_cycle(chains, fixed_cost: int, min_cost: int, path):
+    """
+    Returns the (min_cost, path) of a cycle of the contracted positions, in ID numbers of the original graph
+    (INF, None) if the given path is None
 
-    # Calculate costs for sets of size 0 (base case)
-    for k in vertices-{start_vertex}:
-        g[(frozenset([k]), k)] = graph.get_cost(start_vertex, k)
-        parent[(frozenset([k]), k)] = start_vertex
+    :param chains: The ID numbers of the vertices contracted into each position
+    :param fixed_cost: The sum of the costs inside the chains
+    :param min_cost: The cost of the cycle over the contracted positions
+    :param path: The cycle over the contracted positions, starting and ending with the start chain position
+    """
+    if path is None or min_cost >= UNREACHABLE:
+        return INF, None
 
-    # Iterate over all set sizes
-    for size in range(2, n):
+    cycle = [vertex for position in path[:-1] for vertex in chains[position]]
+    return min_cost + fixed_cost, cycle + [cycle[0]]
 
-        # Iterate over all subsets of size s
-        for include_set in combinations(vertices-{start_vertex}, size):
-            include_set = frozenset(include_set)
 
-            for vertex in include_set:
+# HELD-KARP TABLE FILLING
+def held_karp_masks(g, parent, columns, m: int, masks):
+    """
+    Fills the Held-Karp table entries of the given masks ( each having at least 2 vertices )
+    The entries of every mask with one vertex less must already be filled
 
-                # Initialize minimum cost and best predecessor
-                min_cost = INF
-                best_previous_vertex = None
+    :param g: The flat cost table, indexed by mask * m + j
+    :param parent: The flat parent table, indexed by mask * m + j
+    :param columns: The columns of the cost matrix ( columns[j][k] is the cost of the edge k -> j )
+    :param m: The number of vertices other than the start
+    :param masks: The masks to fill
+    """
+    for mask in masks:
+        members = [j for j in range(m) if mask >> j & 1]
 
-                # Find minimum cost of reaching the vertex from include_set
-                for previous_vertex in include_set:
-                    if vertex != previous_vertex:
-                        cost = g.get((include_set-{vertex}, previous_vertex)) + graph.get_cost(previous_vertex, vertex)
-                        if cost < min_cost:
-                            min_cost = cost
-                            best_previous_vertex = previous_vertex
-                g[(include_set, vertex)] = min_cost
-                parent[(include_set, vertex)] = best_previous_vertex
+        for j in members:
+            # Find minimum cost of reaching j from the walks over mask without j
+            # ( k = j reads a walk over a set without k, which is INF )
+            base = (mask ^ (1 << j)) * m
+            column = columns[j]
+            min_cost, best_previous = min((g[base + k] + column[k], k) for k in members)
+
+            if min_cost < UNREACHABLE:
+                g[mask * m + j] = min_cost
+                parent[mask * m + j] = best_previous
+
+
+# Tables of the current worker process of the parallel Held-Karp ( set by held_karp_worker_init )
+held_karp_worker = {}
+
+
+def held_karp_worker_init(g_name: str, parent_name: str, m: int, columns):
+    """
+    Attaches a worker process of the parallel Held-Karp to the tables kept in shared memory
+
+    :param g_name: The name of the shared memory block of the cost table
+    :param parent_name: The name of the shared memory block of the parent table
+    :param m: The number of vertices other than the start
+    :param columns: The columns of the cost matrix
+    """
+    g_memory = shared_memory.SharedMemory(name=g_name)
+    parent_memory = shared_memory.SharedMemory(name=parent_name)
+    held_karp_worker.update(memories=(g_memory, parent_memory), g=g_memory.buf.cast('q'),
+                            parent=parent_memory.buf.cast('b'), m=m, columns=columns)
+
+
+def held_karp_worker_task(masks):
+    """
+    Fills, inside a worker process, the shared Held-Karp table entries of the given masks of a layer
+    ( The masks of a layer have disjoint entries, so the workers never write the same place )
+
+    :param masks: The masks to fill
+    """
+    held_karp_masks(held_karp_worker['g'], held_karp_worker['parent'], held_karp_worker['columns'],
+                    held_karp_worker['m'], masks)
+
+
+def held_karp_cycle(g, parent, cost, others, start_vertex: int):
+    """
+    Returns the (min_cost, path) of the minimum cost Hamiltonian cycle read from filled Held-Karp tables
+    (INF, None) if there is none
+
+    :param g: The flat cost table, indexed by mask * m + j
+    :param parent: The flat parent table, indexed by mask * m + j
+    :param cost: The dense cost matrix, the start vertex having the last position
+    :param others: The ID numbers of the vertices other than the start
+    :param start_vertex: The ID number of the vertex the cycle starts from
+    """
+    m = len(others)
+    full = (1 << m) - 1
 
     # Find the minimum cost Hamiltonian cycle
     min_cost = INF
-    best_end_vertex = None
-    for vertex in vertices:
-        if vertex != start_vertex:
-            cost = g.get((frozenset(vertices) - {start_vertex}, vertex), INF) + graph.get_cost(vertex, start_vertex)
-            if cost < min_cost:
-                min_cost = cost
-                best_end_vertex = vertex
-
-    # Rebuilding the path
-    path = [start_vertex, best_end_vertex]
-    include_set = frozenset(vertices) - {start_vertex}
-    while len(include_set) > 0:
-        vertex = parent.get((include_set, best_end_vertex))
-        if vertex is None:
-            return INF, None
-        path.append(vertex)
-        include_set -= {best_end_vertex}
-        best_end_vertex = vertex
-    path.reverse()
+    best_end = -1
+    for j in range(m):
+        cycle_cost = g[full * m + j] + cost[j][m]
+        if cycle_cost < min_cost:
+            min_cost = cycle_cost
+            best_end = j
+
+    if min_cost >= UNREACHABLE:
+        return INF, None
+
+    return min_cost, rebuild_cycle(start_vertex, others, lambda mask, j: parent[mask * m + j], best_end)
+
+
+# Solving the Traveling Salesman Problem
+def travelling_salesman_problem(graph: DirectedGraph, start_vertex: int, workers: int = None):
+    """
+    Returns the (min_cost, path) of a minimum cost Hamiltonian cycle, using the Held-Karp dynamic programming
+    The path starts and ends with start_vertex; (INF, None) is returned if the graph has no Hamiltonian cycle
+    ( hamiltonian_cycle_infeasibility() tells why, when the pre-checks could see it )
+    Raises DirectedGraphException if start_vertex is not inside the graph
+
+    With workers > 1, the subsets of each size are split across a pool of worker processes, which read and write
+    the tables in shared memory ( the result is exactly the one of the serial run )
+
+    :param graph: The Directed Graph ( or Frozen Directed Graph ) to search
+    :param start_vertex: The ID number of the vertex the cycle starts from
+    :param workers: Optional number of worker processes
+    """
+    prepared = prepare_travelling_salesman_problem(graph, start_vertex)
+    if prepared is None:
+        return INF, None
+    chains, cost, fixed_cost = prepared
+    m = len(chains) - 1
+    if m == 0:
+        return expand_cycle(chains, fixed_cost, cost[0][0], [0, 0])
+    others = list(range(m))
+
+    # Columns of the cost matrix: the costs of reaching each vertex
+    columns = [list(column) for column in zip(*cost)]
+    entries = (1 << m) * m
+
+    if workers is None or workers < 2:
+        # Flat Held-Karp tables, indexed by mask * m + j
+        g = array('q', [INF]) * entries
+        parent = array('b', [-1]) * entries
+
+        # Base case: walks visiting a single vertex
+        for j in range(m):
+            g[(1 << j) * m + j] = cost[m][j]
+
+        # Subsets in increasing mask order, so every subset comes after the subsets it extends
+        held_karp_masks(g, parent, columns, m, (mask for mask in range(1, 1 << m) if mask & (mask - 1)))
+
+        # Returning the result
+        return expand_cycle(chains, fixed_cost, *held_karp_cycle(g, parent, cost, others, m))
+
+    # The same tables, in shared memory blocks
+    g_memory = shared_memory.SharedMemory(create=True, size=entries * 8)
+    parent_memory = shared_memory.SharedMemory(create=True, size=entries)
+    g = parent = None
+    try:
+        g = g_memory.buf.cast('q')
+        parent = parent_memory.buf.cast('b')
+        g[:] = array('q', [INF]) * entries
+        parent[:] = array('b', [-1]) * entries
+
+        # Base case: walks visiting a single vertex
+        for j in range(m):
+            g[(1 << j) * m + j] = cost[m][j]
+
+        # Layers of subsets by size, each one split in chunks between the workers
+        with ProcessPoolExecutor(max_workers=workers, initializer=held_karp_worker_init,
+                                 initargs=(g_memory.name, parent_memory.name, m, columns)) as executor:
+            for size in range(2, m + 1):
+                layer = [sum(1 << j for j in subset) for subset in combinations(range(m), size)]
+                chunk = -(-len(layer) // (4 * workers))
+                for _ in executor.map(held_karp_worker_task, [layer[i:i + chunk] for i in range(0, len(layer), chunk)]):
+                    pass
+
+        # Returning the result
+        return expand_cycle(chains, fixed_cost, *held_karp_cycle(g, parent, cost, others, m))
+
+    finally:
+        if g is not None:
+            g.release()
+        if parent is not None:
+            parent.release()
+        g_memory.close()
+        g_memory.unlink()
+        parent_memory.close()
+        parent_memory.unlink()
+
+
+# BRANCH AND BOUND LOWER BOUND
+def reduced_cost_bound(cost, current: int, unvisited, start: int):
+    """
+    Returns a lower bound of the cost of finishing a cycle from current through all the unvisited vertices to start
+    ( The reduction of the cost matrix restricted to the edges such a finish may use: the sum of the row minimums
+    plus the sum of the column minimums of what is left, for the rows current + unvisited and the columns
+    unvisited + start ); INF if some vertex cannot be left or entered anymore
+
+    :param cost: The dense cost matrix
+    :param current: The position of the last vertex of the walk
+    :param unvisited: The positions of the vertices not visited yet
+    :param start: The position of the start vertex
+    """
+    rows = [current] + unvisited
+    columns = unvisited + [start]
+
+    # The walk can only go back to start from its last unvisited vertex
+    def allowed(row, column):
+        return row != column and not (row == current and column == start and unvisited)
+
+    # Row reduction
+    row_minimums = {}
+    for row in rows:
+        row_minimums[row] = min((cost[row][column] for column in columns if allowed(row, column)), default=INF)
+        if row_minimums[row] >= UNREACHABLE:
+            return INF
+    bound = sum(row_minimums.values())
+
+    # Column reduction of the row reduced matrix
+    for column in columns:
+        column_minimum = min((cost[row][column] - row_minimums[row] for row in rows
+                              if allowed(row, column) and cost[row][column] < UNREACHABLE), default=INF)
+        if column_minimum >= UNREACHABLE:
+            return INF
+        bound += column_minimum
+
+    return bound
+
+
+# Solving the Traveling Salesman Problem by Branch and Bound
+def branch_and_bound_travelling_salesman_problem(graph: DirectedGraph, start_vertex: int,
+                                                 node_limit: int = None, time_limit: float = None):
+    """
+    Returns the same (min_cost, path) as travelling_salesman_problem, using a depth-first branch and bound
+    which only keeps the current walk in memory ( no 2^n tables )
+    - the nearest neighbour tour, if there is one, gives the first upper bound
+    - a walk is cut as soon as its cost plus reduced_cost_bound() reaches the best cycle found
+      ( so dead ends of sparse digraphs are cut at once )
+    - the next vertices are tried cheapest edge first
+
+    If node_limit ( walks expanded ) or time_limit ( seconds ) is given and reached, the search stops
+    and the best cycle found so far is returned, which may then not be the minimum one
+    Raises DirectedGraphException if start_vertex is not inside the graph
+
+    :param graph: The Directed Graph ( or Frozen Directed Graph ) to search
+    :param start_vertex: The ID number of the vertex the cycle starts from
+    :param node_limit: Optional maximum number of walks to expand
+    :param time_limit: Optional maximum number of seconds to search
+    """
+    prepared = prepare_travelling_salesman_problem(graph, start_vertex)
+    if prepared is None:
+        return INF, None
+    chains, cost, fixed_cost = prepared
+    m = len(chains) - 1
+    if m == 0:
+        return expand_cycle(chains, fixed_cost, cost[0][0], [0, 0])
+    start = m
+    deadline = None if time_limit is None else time.monotonic() + time_limit
+
+    # Initial upper bound: the nearest neighbour tour
+    best_cost = INF
+    best_walk = None
+    walk = [start]
+    unvisited = set(range(m))
+    walk_cost = 0
+    while unvisited:
+        following = min(unvisited, key=lambda vertex: cost[walk[-1]][vertex])
+        if cost[walk[-1]][following] >= UNREACHABLE:
+            break
+        walk_cost += cost[walk[-1]][following]
+        walk.append(following)
+        unvisited.remove(following)
+    if not unvisited and cost[walk[-1]][start] < UNREACHABLE:
+        best_cost = walk_cost + cost[walk[-1]][start]
+        best_walk = walk
+
+    # Depth-first search, with an explicit stack of ( walk, walk cost ) states
+    expanded = 0
+    stack = [([start], 0)]
+    while stack:
+        if node_limit is not None and expanded >= node_limit:
+            break
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+
+        walk, walk_cost = stack.pop()
+        expanded += 1
+        current = walk[-1]
+        visited = set(walk)
+        unvisited = [vertex for vertex in range(m) if vertex not in visited]
+
+        # A complete walk closes the cycle
+        if not unvisited:
+            if cost[current][start] < UNREACHABLE and walk_cost + cost[current][start] < best_cost:
+                best_cost = walk_cost + cost[current][start]
+                best_walk = walk
+            continue
+
+        if walk_cost + reduced_cost_bound(cost, current, unvisited, start) >= best_cost:
+            continue
+
+        # Pushing the costliest extension first, so the cheapest one is expanded first
+        extensions = sorted((vertex for vertex in unvisited if cost[current][vertex] < UNREACHABLE),
+                            key=lambda vertex: cost[current][vertex], reverse=True)
+        for vertex in extensions:
+            stack.append((walk + [vertex], walk_cost + cost[current][vertex]))
+
+    if best_walk is None:
+        return INF, None
 
     # Returning the result
-    return min_cost, path
+    return expand_cycle(chains, fixed_cost, best_cost, best_walk + [start])
+
+
+# Solving the Traveling Salesman Problem with NumPy
+def vectorised_travelling_salesman_problem(graph: DirectedGraph, start_vertex: int):
+    """
+    Returns the same (min_cost, path) as travelling_salesman_problem, computing every subset size layer of the
+    Held-Karp tables with NumPy min / argmin reductions instead of Python loops over the subsets
+    The tables are (2^m, m) int64 costs and int8 parents, so memory is 9 * 2^m * m bytes
+    Raises DirectedGraphException if start_vertex is not inside the graph, or if NumPy is not installed
+
+    :param graph: The Directed Graph ( or Frozen Directed Graph ) to search
+    :param start_vertex: The ID number of the vertex the cycle starts from
+    """
+    if numpy is None:
+        raise DirectedGraphException("The vectorised TSP needs NumPy, which is not installed")
+
+    prepared = prepare_travelling_salesman_problem(graph, start_vertex)
+    if prepared is None:
+        return INF, None
+    chains, cost, fixed_cost = prepared
+    m = len(chains) - 1
+    if m == 0:
+        return expand_cycle(chains, fixed_cost, cost[0][0], [0, 0])
+    others = list(range(m))
+    cost = numpy.array(cost, dtype=numpy.int64)
+    start = m
+
+    # Tables indexed by [mask, j]
+    g = numpy.full((1 << m, m), INF, dtype=numpy.int64)
+    parent = numpy.full((1 << m, m), -1, dtype=numpy.int8)
+
+    # Base case: walks visiting a single vertex
+    singles = numpy.arange(m)
+    g[1 << singles, singles] = cost[start, :m]
+
+    # Grouping the masks by their size ( number of set bits )
+    masks = numpy.arange(1 << m, dtype=numpy.int64)
+    sizes = numpy.zeros(1 << m, dtype=numpy.int8)
+    for j in range(m):
+        sizes += ((masks >> j) & 1).astype(numpy.int8)
+
+    for size in range(2, m + 1):
+        layer = masks[sizes == size]
+        for j in range(m):
+            # Walks over the masks of the layer containing j, ending in j
+            ending = layer[(layer >> j) & 1 == 1]
+            candidates = g[ending ^ (1 << j)] + cost[:m, j]
+            best_previous = candidates.argmin(axis=1)
+            min_cost = candidates[numpy.arange(len(ending)), best_previous]
+
+            reachable = min_cost < UNREACHABLE
+            g[ending[reachable], j] = min_cost[reachable]
+            parent[ending[reachable], j] = best_previous[reachable]
+
+    # Find the minimum cost Hamiltonian cycle
+    full = (1 << m) - 1
+    cycle_costs = g[full] + cost[:m, start]
+    best_end = int(cycle_costs.argmin())
+    min_cost = int(cycle_costs[best_end])
+    if min_cost >= UNREACHABLE:
+        return INF, None
+
+    # Returning the result
+    path = rebuild_cycle(m, others, lambda mask, j: parent[mask, j], best_end)
+    return expand_cycle(chains, fixed_cost, min_cost, path)
+
+
+# HEURISTIC SOLVER TOUR CONSTRUCTION
+def nearest_neighbour_tour(out_costs, neighbours, start: int):
+    """
+    Returns a tour of all the dense ids, starting at start and going each time to the cheapest unvisited out-neighbour
+    ( Jumping, through a missing edge, to some unvisited vertex when the walk reaches a dead end )
+
+    :param out_costs: The list of the outbound neighbour -> cost dictionaries, by dense id
+    :param neighbours: The list of the out-neighbours of each dense id, cheapest first
+    :param start: The dense id of the start vertex
+    """
+    n = len(out_costs)
+    visited = [False] * n
+    visited[start] = True
+    tour = [start]
+    next_unvisited = 0
+
+    while len(tour) < n:
+        current = tour[-1]
+        following = next((vertex for vertex in neighbours[current] if not visited[vertex]), None)
+        if following is None:
+            while visited[next_unvisited]:
+                next_unvisited += 1
+            following = next_unvisited
+        visited[following] = True
+        tour.append(following)
+
+    return tour
 
 
+def greedy_edge_tour(out_costs, start: int):
+    """
+    Returns a tour of all the dense ids, starting at start, built from the cheapest edges first
+    ( An edge is kept if its source has no successor yet, its target no predecessor yet, and it closes no cycle;
+    the paths left are then chained together, through missing edges where needed )
+
+    :param out_costs: The list of the outbound neighbour -> cost dictionaries, by dense id
+    :param start: The dense id of the start vertex
+    """
+    n = len(out_costs)
+    successor = [-1] * n
+    predecessor = [-1] * n
+
+    # Union-find over the paths built so far
+    leader = list(range(n))
+
+    def find(vertex):
+        while leader[vertex] != vertex:
+            leader[vertex] = leader[leader[vertex]]
+            vertex = leader[vertex]
+        return vertex
+
+    edges = sorted((cost, source, target) for source in range(n)
+                   for (target, cost) in out_costs[source].items() if source != target)
+    for (_, source, target) in edges:
+        if successor[source] == -1 and predecessor[target] == -1 and find(source) != find(target):
+            successor[source] = target
+            predecessor[target] = source
+            leader[find(source)] = find(target)
+
+    # Chaining the paths, starting with the one holding start
+    head = start
+    while predecessor[head] != -1:
+        head = predecessor[head]
+    heads = [head] + [vertex for vertex in range(n) if predecessor[vertex] == -1 and vertex != head]
+
+    tour = []
+    for head in heads:
+        vertex = head
+        while vertex != -1:
+            tour.append(vertex)
+            vertex = successor[vertex]
+
+    # Rotating the cycle so that it starts at start
+    position = tour.index(start)
+    return tour[position:] + tour[:position]
+
+
+# Solving the Traveling Salesman Problem heuristically
+def heuristic_travelling_salesman_problem(graph: DirectedGraph, start_vertex: int, time_limit: float = 2.0,
+                                         construction: str = NEAREST_NEIGHBOUR, candidates_count: int = 8,
+                                         seed: int = 0):
+    """
+    Returns the (min_cost, path) of a good, but not necessarily minimum, Hamiltonian cycle, in the same shape as
+    travelling_salesman_problem, or (INF, None) if the search found no Hamiltonian cycle
+    ( Graphs of at most EXACT_VERTICES vertices are solved exactly by travelling_salesman_problem instead )
+    - the first tour is built by NEAREST_NEIGHBOUR or GREEDY_EDGE ( missing edges count as INF ), then every
+      missing edge it walks is replaced, where possible, by segment swaps adding edges of the graph ( see
+      EJECTION_STEPS )
+    - it is improved by directed 2-opt moves ( reversing a segment, with its edges costed in the new direction )
+      and Or-opt moves ( moving a segment of 1 to 3 vertices elsewhere ), only tried towards the candidates_count
+      cheapest neighbours of each vertex ( all of them next to a missing edge ), until a whole pass improves
+      nothing, then kicked by random double bridges, repaired and improved again while the time_limit seconds last,
+      a kicked tour being kept if it walks fewer missing edges, or as many but is cheaper
+    The time_limit starts once the first tour is built and repaired, so a tight budget never turns a tour the
+    repair made feasible into (INF, None)
+    Raises DirectedGraphException if start_vertex is not inside the graph
+
+    :param graph: The Directed Graph ( or Frozen Directed Graph ) to search
+    :param start_vertex: The ID number of the vertex the cycle starts from
+    :param time_limit: The number of seconds, after the first tour is built and repaired, when the improvement stops
+    :param construction: The way of building the first tour, NEAREST_NEIGHBOUR or GREEDY_EDGE
+    :param candidates_count: The number of cheapest neighbours the moves are tried towards
+    :param seed: The seed of the random kicks and repair swaps, the same seed giving the same search
+    """
+    frozen = graph.freeze()
+    start = frozen.index_of(start_vertex)
+    if start is None:
+        raise DirectedGraphException("Vertex not inside the DirectedGraph")
+    if construction not in (NEAREST_NEIGHBOUR, GREEDY_EDGE):
+        raise DirectedGraphException(f"Unknown tour construction: {construction}")
+
+    n = frozen.vertices_count()
+    if n <= EXACT_VERTICES:
+        return travelling_salesman_problem(frozen, start_vertex)
+    if hamiltonian_cycle_infeasibility(frozen) is not None:
+        return INF, None
+
+    # Outbound costs and neighbours lists ( cheapest first ), by dense id
+    out_costs = [{} for _ in range(n)]
+    for vertex in range(n):
+        for edge in range(frozen.out_offsets[vertex], frozen.out_offsets[vertex + 1]):
+            if frozen.out_targets[edge] != vertex:
+                out_costs[vertex][frozen.out_targets[edge]] = frozen.out_costs[edge]
+    out_neighbours = [sorted(costs, key=costs.get) for costs in out_costs]
+    in_neighbours = [[] for _ in range(n)]
+    for vertex in range(n):
+        for target in out_neighbours[vertex]:
+            in_neighbours[target].append(vertex)
+    for vertex in range(n):
+        in_neighbours[vertex].sort(key=lambda source: out_costs[source][vertex])
+
+    def edge_cost(source, target):
+        return out_costs[source].get(target, INF)
+
+    def candidates(neighbours, source, target):
+        # Every neighbour is worth trying while the tour still walks the missing edge source -> target
+        if target in out_costs[source]:
+            return neighbours[:candidates_count]
+        return neighbours
+
+    if construction == NEAREST_NEIGHBOUR:
+        tour = nearest_neighbour_tour(out_costs, out_neighbours, start)
+    else:
+        tour = greedy_edge_tour(out_costs, start)
+
+    def reconnect(tour):
+        # Replaces in place the missing edges a -> b of the tour by segment swaps: with the cycle read from b,
+        # b ... x y ... u v ... a becomes y ... u b ... x v ... a, the new edges a -> y and u -> b being taken from
+        # the out-neighbours of a and the in-neighbours of b
+        # The cheapest swap where x -> v exists too is kept; when there is none, a random swap moves the missing edge
+        # to x -> v and the search goes on from there, for at most EJECTION_STEPS swaps ( an ejection chain, which
+        # never adds missing edges )
+        repaired = True
+        while repaired:
+            repaired = False
+            for index in range(n):
+                if tour[index] in out_costs[tour[index - 1]]:
+                    continue
+
+                for _ in range(EJECTION_STEPS):
+                    cycle = tour[index:] + tour[:index]
+                    where = {vertex: place for (place, vertex) in enumerate(cycle)}
+                    a, b = cycle[-1], cycle[0]
+                    best = None
+                    sideways = []
+                    for y in out_neighbours[a]:
+                        j = where[y]
+                        for u in in_neighbours[b]:
+                            k = where[u] + 1
+                            if k <= j or k >= n:
+                                continue
+                            x, v = cycle[j - 1], cycle[k]
+                            if v not in out_costs[x]:
+                                sideways.append((j, k))
+                                continue
+                            delta = (edge_cost(a, y) + edge_cost(u, b) + edge_cost(x, v)
+                                     - edge_cost(a, b) - edge_cost(x, y) - edge_cost(u, v))
+                            if best is None or delta < best[0]:
+                                best = (delta, j, k)
+
+                    if best is None and not sideways:
+                        break
+                    j, k = best[1:] if best is not None else shuffle.choice(sideways)
+                    cycle = cycle[j:k] + cycle[:j] + cycle[k:]
+                    first = cycle.index(start)
+                    tour[:] = cycle[first:] + cycle[:first]
+                    if best is not None:
+                        repaired = True
+                        break
+
+                    # The missing edge is now x -> v, v being at the place k of the swapped cycle
+                    index = (k - first) % n
+
+                if repaired:
+                    break
+
+    # Positions in the tour and prefix sums of its costs, forwards and backwards, to cost reversed segments in O(1)
+    position = [0] * n
+    forward = [0] * n
+    backward = [0] * n
+
+    def refresh(tour, first_index):
+        for index in range(first_index, n):
+            position[tour[index]] = index
+            if index:
+                forward[index] = forward[index - 1] + edge_cost(tour[index - 1], tour[index])
+                backward[index] = backward[index - 1] + edge_cost(tour[index], tour[index - 1])
+
+    def tour_cost(tour):
+        return sum(edge_cost(tour[index], tour[(index + 1) % n]) for index in range(n))
+
+    def local_search(tour):
+        # Improves the tour in place until a whole pass finds no better move or the time is up
+        # The tour is seen as the cycle tour[0] -> ... -> tour[n-1] -> tour[0], tour[0] being the fixed start
+        refresh(tour, 0)
+        improved = True
+        while improved:
+            improved = False
+            for i in range(1, n):
+                if time.monotonic() >= deadline:
+                    break
+
+                # Directed 2-opt: a -> tour[i] ... tour[j] -> b becomes a -> tour[j] ... tour[i] -> b
+                a = tour[i - 1]
+                for vertex in candidates(out_neighbours[a], a, tour[i]):
+                    j = position[vertex]
+                    if j <= i:
+                        continue
+                    b = tour[(j + 1) % n]
+                    delta = (edge_cost(a, tour[j]) + edge_cost(tour[i], b) + backward[j] - backward[i]
+                             - edge_cost(a, tour[i]) - edge_cost(tour[j], b) - forward[j] + forward[i])
+                    if delta < 0:
+                        tour[i:j + 1] = tour[i:j + 1][::-1]
+                        refresh(tour, i)
+                        improved = True
+                        break
+
+                # Or-opt: the segment tour[i...i+length-1] moves between tour[k] and its successor, tour[k] being
+                # an in-neighbour of the first vertex of the segment or its successor an out-neighbour of the last one
+                for length in (1, 2, 3):
+                    if i + length > n:
+                        break
+                    first, last = tour[i], tour[i + length - 1]
+                    before, after = tour[i - 1], tour[(i + length) % n]
+                    removal = edge_cost(before, after) - edge_cost(before, first) - edge_cost(last, after)
+                    places = ([position[p] for p in candidates(in_neighbours[first], before, first)]
+                              + [position[q] - 1 if position[q] else n - 1
+                                 for q in candidates(out_neighbours[last], last, after)])
+                    for k in places:
+                        if i - 1 <= k < i + length:
+                            continue
+                        p, q = tour[k], tour[(k + 1) % n]
+                        if removal + edge_cost(p, first) + edge_cost(last, q) - edge_cost(p, q) < 0:
+                            segment = tour[i:i + length]
+                            del tour[i:i + length]
+                            insert = k + 1 if k < i else k + 1 - length
+                            tour[insert:insert] = segment
+                            refresh(tour, min(i, insert))
+                            improved = True
+                            break
+                    else:
+                        continue
+                    break
+
+    def missing_edges(tour):
+        return sum(1 for index in range(n) if tour[index] not in out_costs[tour[index - 1]])
+
+    # Kicking the best tour found with random double bridges ( moving segments without reversing them, which local
+    # moves cannot undo ) and searching again from there, until the time is up
+    shuffle = random.Random(seed)
+    reconnect(tour)
+    deadline = time.monotonic() + time_limit
+    local_search(tour)
+    best = (missing_edges(tour), tour_cost(tour))
+    while n >= 8 and time.monotonic() < deadline:
+        first, second, third = sorted(shuffle.sample(range(2, n), 3))
+        candidate = tour[:first] + tour[second:third] + tour[first:second] + tour[third:]
+        reconnect(candidate)
+
+        # Tours walking fewer missing edges come first, then cheaper ones ( a repaired tour still walking more
+        # missing edges than the best one is not worth improving )
+        missing = missing_edges(candidate)
+        if missing > best[0]:
+            continue
+        local_search(candidate)
+        candidate_score = (missing_edges(candidate), tour_cost(candidate))
+        if candidate_score < best:
+            tour, best = candidate, candidate_score
+    best_cost = best[1]
+
+    if best_cost >= UNREACHABLE:
+        return INF, None
+
+    # Returning the result
+    numbers = frozen.vertex_numbers
+    return best_cost, [numbers[vertex] for vertex in tour] + [start_vertex]
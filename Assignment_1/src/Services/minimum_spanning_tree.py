@@ -4,69 +4,537 @@
 # Write a program that, given an undirected connected graph,
 # constructs a minimal spanning tree using the Prim's algorithm.
 #
+# Besides Prim's algorithm, the module holds Kruskal's and ( NumPy only ) Borůvka's algorithms, picked through
+# minimum_spanning_tree(); all of them also accept disconnected graphs and return a minimum spanning forest
+# ( a minimum spanning tree of every connected component )
+# MinimumSpanningTreeMaintainer keeps such a forest up to date while the graph is modified
+#
 
 # IMPORTS SECTION
-import heapq
+import math
+from array import array
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+try:
+    import numpy
+except ImportError:
+    numpy = None
 from Assignment_1.src.Domain.vertex import Vertex
 from Assignment_1.src.Domain.edge import Edge, UEdge
+from Assignment_1.src.Domain.disjoint_set import DisjointSet
+from Assignment_1.src.Domain.indexed_heap import IndexedHeap
 from Assignment_1.src.Domain.undirected_graph import (UnDirectedGraph, UnDirectedGraphVertexIterator,
                                                       UnDirectedGraphEdgesIterator, UnDirectedGraphException)
 
 
+# Definition Section
+# Engines able to compute the minimum spanning trees
+PRIM = "prim"
+KRUSKAL = "kruskal"
+BORUVKA = "boruvka"
+
+# NOTE:
+# The trees are returned as sets of ( Vertex, parent Vertex, cost ) tuples, edges without a cost counting as 0
+# Both engines read the costs once per edge from the CSR arrays of graph.freeze()
+# Prim pays O(E + V log V) heap work, Kruskal one sort of the E costs: PRIM is picked when the average degree
+# 2E / V reaches PRIM_DEGREE_FACTOR * log2(V), KRUSKAL below
+PRIM_DEGREE_FACTOR = 1
+
+
 # PRIM'S ALGORITHM IMPLEMENTATION
-def prim_minimum_spanning_tree(graph: UnDirectedGraph):
+def prim_minimum_spanning_tree(graph: UnDirectedGraph, spanning_forest: bool = False):
+    """
+    Returns the edges of a minimum spanning tree of the component of the first vertex of graph.vertices(),
+    or with spanning_forest, of a minimum spanning tree of every component ( an empty set for an empty graph )
+    The vertices wait in an IndexedHeap keyed by their cheapest edge to the tree, lowered in place
+    ( decrease-key ), so the heap never holds more than V entries
+
+    :param graph: The UnDirected Graph ( or Frozen UnDirected Graph )
+    :param spanning_forest: Whether to span all the components instead of the first one only
+    """
+    frozen = graph.freeze()
+    n = frozen.vertices_count()
+    offsets, targets, costs = frozen.offsets, frozen.targets, frozen.costs
+    numbers = frozen.vertex_numbers
 
     # Initialize variables
-    q = []
     edges = set()
-    vertices = set()
-    parent = {}
-    dist = {}
+    in_tree = [False] * n
+    parent = [-1] * n
+    queue = IndexedHeap(n)
 
-    # Pick start vertex arbitrary
-    start_vertex = graph.vertices()[0]
-    vertices.add(start_vertex)
+    for root in range(n if spanning_forest else min(n, 1)):
+        if in_tree[root]:
+            continue
+        queue.push(root, 0)
 
-    iterator = graph.edges_iterator(start_vertex.number)
-    while iterator.valid():
+        while queue:
+            vertex, cost = queue.pop()
+            in_tree[vertex] = True
+            if parent[vertex] != -1:
+                edges.add((Vertex(numbers[vertex]), Vertex(numbers[parent[vertex]]), cost))
 
-        # Getting the next vertex
-        edge = iterator.getCurrent()
-        if start_vertex != edge.target:
-            new_vertex = edge.target
-        else:
-            new_vertex = edge.source
+            for position in range(offsets[vertex], offsets[vertex + 1]):
+                neighbour = targets[position]
+                if not in_tree[neighbour] and queue.push(neighbour, costs[position]):
+                    parent[neighbour] = vertex
+
+    # Returning the edges used in the resulting tree
+    return edges
 
-        # Processing the new vertex
-        dist[new_vertex] = graph.get_cost(new_vertex.number, start_vertex.number)
-        parent[new_vertex] = start_vertex
-        heapq.heappush(q, (dist[new_vertex], new_vertex))
 
-        iterator.next()
+# KRUSKAL'S ALGORITHM IMPLEMENTATION
+def kruskal_minimum_spanning_tree(graph: UnDirectedGraph):
+    """
+    Returns the edges of a minimum spanning forest ( a minimum spanning tree of every component )
+    The edges are taken in increasing cost order ( one sort of the array of the edge costs ), and kept when a
+    DisjointSet of the dense ids shows they join two different trees
 
-    while q:
-        vertex = heapq.heappop(q)[1]
-        if vertex not in vertices:
-            edges.add((vertex, parent[vertex], graph.get_cost(vertex.number, parent[vertex].number)))
-            vertices.add(vertex)
+    :param graph: The UnDirected Graph ( or Frozen UnDirected Graph )
+    """
+    frozen = graph.freeze()
+    n = frozen.vertices_count()
+    offsets, targets, costs = frozen.offsets, frozen.targets, frozen.costs
+    numbers = frozen.vertex_numbers
 
-            iterator = graph.edges_iterator(vertex.number)
-            while iterator.valid():
+    # Every edge once, from its smaller dense id
+    sources = array('q')
+    ends = array('q')
+    edge_costs = array('q')
+    for vertex in range(n):
+        for position in range(offsets[vertex], offsets[vertex + 1]):
+            if vertex < targets[position]:
+                sources.append(vertex)
+                ends.append(targets[position])
+                edge_costs.append(costs[position])
 
-                # Getting the next vertex
-                edge = iterator.getCurrent()
-                if vertex != edge.target:
-                    new_vertex = edge.target
-                else:
-                    new_vertex = edge.source
+    edges = set()
+    trees = DisjointSet(range(n))
+    for index in sorted(range(len(edge_costs)), key=edge_costs.__getitem__):
+        if trees.union(sources[index], ends[index]):
+            edges.add((Vertex(numbers[ends[index]]), Vertex(numbers[sources[index]]), edge_costs[index]))
+            if len(edges) == n - 1:
+                break
 
-                if new_vertex not in dist.keys() or graph.get_cost(vertex.number, new_vertex.number) < dist[new_vertex]:
-                    dist[new_vertex] = graph.get_cost(vertex.number, new_vertex.number)
-                    heapq.heappush(q, (dist[new_vertex], new_vertex))
-                    parent[new_vertex] = vertex
+    # Returning the edges used in the resulting forest
+    return edges
 
-                iterator.next()
 
-    # Returning the edges used in the resulting tree
+# BORUVKA'S ALGORITHM IMPLEMENTATION ( NUMPY )
+def boruvka_cheapest_edges(labels, sources, targets, ranks, edges_count: int):
+    """
+    Returns the NumPy array giving, for every component label, the smallest rank of an edge leaving the component
+    ( edges_count for the labels of no component, or of components without a leaving edge )
+
+    :param labels: The NumPy array of the component labels of the dense ids
+    :param sources: The NumPy array of the dense ids of the edge sources
+    :param targets: The NumPy array of the dense ids of the edge targets
+    :param ranks: The NumPy array of the ranks of the edges ( their positions in increasing ( cost, index ) order )
+    :param edges_count: The number of edges of the whole graph
+    """
+    source_labels = labels[sources]
+    target_labels = labels[targets]
+    leaving = source_labels != target_labels
+    source_labels = source_labels[leaving]
+    target_labels = target_labels[leaving]
+    ranks = ranks[leaving]
+
+    cheapest = numpy.full(len(labels), edges_count, dtype=numpy.int64)
+    numpy.minimum.at(cheapest, source_labels, ranks)
+    numpy.minimum.at(cheapest, target_labels, ranks)
+    return cheapest
+
+
+# Edge arrays of the current worker process of the parallel Borůvka ( set by boruvka_worker_init )
+boruvka_worker = {}
+
+
+def boruvka_worker_init(sources, targets, ranks):
+    """
+    Keeps, inside a worker process of the parallel Borůvka, the edge arrays every round scans
+
+    :param sources: The NumPy array of the dense ids of the edge sources
+    :param targets: The NumPy array of the dense ids of the edge targets
+    :param ranks: The NumPy array of the ranks of the edges
+    """
+    boruvka_worker.update(sources=sources, targets=targets, ranks=ranks)
+
+
+def boruvka_worker_task(task):
+    """
+    Returns, from inside a worker process, the boruvka_cheapest_edges() of a range of the edges
+
+    :param task: The ( labels, start, end ) tuple of the component labels and of the range of edges to scan
+    """
+    labels, start, end = task
+    return boruvka_cheapest_edges(labels, boruvka_worker['sources'][start:end], boruvka_worker['targets'][start:end],
+                                  boruvka_worker['ranks'][start:end], len(boruvka_worker['ranks']))
+
+
+def boruvka_minimum_spanning_tree(graph: UnDirectedGraph, workers: int = None):
+    """
+    Returns the edges of a minimum spanning forest ( a minimum spanning tree of every component )
+    Every round finds the cheapest edge leaving each component with a NumPy grouped minimum over the edge arrays,
+    then joins the components along these edges with a union-find, so there are at most log2(V) rounds
+    The edges are ordered by ( cost, position in the CSR arrays ), so ties are always broken the same way
+    Raises UnDirectedGraphException if NumPy is not installed
+
+    With workers > 1, the edge arrays are split in ranges scanned by a pool of worker processes every round
+    ( the result is exactly the one of the serial run )
+
+    :param graph: The UnDirected Graph ( or Frozen UnDirected Graph )
+    :param workers: Optional number of worker processes
+    """
+    if numpy is None:
+        raise UnDirectedGraphException("The Boruvka minimum spanning tree needs NumPy, which is not installed")
+
+    frozen = graph.freeze()
+    n = frozen.vertices_count()
+    numbers = frozen.vertex_numbers
+
+    # Every edge once, from its smaller dense id
+    offsets = numpy.asarray(frozen.offsets, dtype=numpy.int64)
+    sources = numpy.repeat(numpy.arange(n, dtype=numpy.int64), numpy.diff(offsets))
+    targets = numpy.asarray(frozen.targets, dtype=numpy.int64)
+    costs = numpy.asarray(frozen.costs, dtype=numpy.int64)
+    once = sources < targets
+    sources, targets, costs = sources[once], targets[once], costs[once]
+    m = len(costs)
+
+    # Ranks of the edges in increasing ( cost, index ) order, and the edges by rank
+    by_rank = numpy.argsort(costs, kind='stable')
+    ranks = numpy.empty(m, dtype=numpy.int64)
+    ranks[by_rank] = numpy.arange(m, dtype=numpy.int64)
+
+    edges = set()
+    labels = numpy.arange(n, dtype=numpy.int64)
+    leader = list(range(n))
+
+    def find(vertex):
+        while leader[vertex] != vertex:
+            leader[vertex] = leader[leader[vertex]]
+            vertex = leader[vertex]
+        return vertex
+
+    parallel = workers is not None and workers > 1 and m > 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=boruvka_worker_init,
+                             initargs=(sources, targets, ranks)) if parallel else nullcontext() as executor:
+        while True:
+            # Cheapest edge leaving every component
+            if parallel:
+                chunk = -(-m // workers)
+                tasks = [(labels, start, min(start + chunk, m)) for start in range(0, m, chunk)]
+                cheapest = numpy.minimum.reduce(list(executor.map(boruvka_worker_task, tasks)))
+            else:
+                cheapest = boruvka_cheapest_edges(labels, sources, targets, ranks, m)
+            chosen = numpy.unique(cheapest[cheapest < m])
+            if len(chosen) == 0:
+                break
+
+            # Joining the components along the chosen edges ( in rank order, so each one joins two trees )
+            chosen = by_rank[chosen]
+            for (source, target, source_label, target_label, cost) in zip(
+                    sources[chosen].tolist(), targets[chosen].tolist(), labels[sources[chosen]].tolist(),
+                    labels[targets[chosen]].tolist(), costs[chosen].tolist()):
+                source_label, target_label = find(source_label), find(target_label)
+                if source_label != target_label:
+                    leader[source_label] = target_label
+                    edges.add((Vertex(numbers[target]), Vertex(numbers[source]), cost))
+
+            # Relabelling through the leaders of the labels still in use ( fewer than half of them every round )
+            in_use = numpy.unique(labels)
+            relabel = numpy.arange(n, dtype=numpy.int64)
+            relabel[in_use] = [find(label) for label in in_use.tolist()]
+            labels = relabel[labels]
+
+    # Returning the edges used in the resulting forest
     return edges
 
+
+# ENGINE SELECTION
+def choose_spanning_tree_algorithm(graph):
+    """
+    Returns the name of the engine used by default for the minimum spanning forests of the given graph
+    ( PRIM for dense graphs, KRUSKAL for sparse ones, see PRIM_DEGREE_FACTOR )
+
+    :param graph: The UnDirected Graph ( or Frozen UnDirected Graph )
+    """
+    n = graph.vertices_count()
+    if n > 1 and 2 * graph.edges_count() >= PRIM_DEGREE_FACTOR * n * math.log2(n):
+        return PRIM
+    return KRUSKAL
+
+
+def minimum_spanning_tree(graph: UnDirectedGraph, algorithm: str = None, workers: int = None):
+    """
+    Returns the edges of a minimum spanning forest ( a minimum spanning tree of every component )
+
+    :param graph: The UnDirected Graph ( or Frozen UnDirected Graph )
+    :param algorithm: The engine to use ( PRIM, KRUSKAL or BORUVKA ), None to let choose_spanning_tree_algorithm()
+                      pick PRIM or KRUSKAL
+    :param workers: Optional number of worker processes ( BORUVKA only, see boruvka_minimum_spanning_tree() )
+    """
+    if algorithm is None:
+        algorithm = choose_spanning_tree_algorithm(graph)
+
+    if algorithm == PRIM:
+        return prim_minimum_spanning_tree(graph, spanning_forest=True)
+    if algorithm == KRUSKAL:
+        return kruskal_minimum_spanning_tree(graph)
+    if algorithm == BORUVKA:
+        return boruvka_minimum_spanning_tree(graph, workers)
+    raise UnDirectedGraphException(f"Unknown minimum spanning tree algorithm: {algorithm}")
+
+
+# INCREMENTAL MINIMUM SPANNING FOREST MAINTAINER
+# Internal Representation Specifications:
+# The minimum spanning forest of the bound graph is kept as an adjacency dictionary ( vertex -> { neighbour: cost } ),
+# and as parent pointers of rooted trees, so the forest path between two vertices is found by climbing from both ends
+# ( linking two trees reroots one of them at the linked vertex, reversing the pointers on its way to the old root )
+# Every modification goes through the maintainer, which applies it to the graph and repairs the forest:
+# - a new edge, or a lowered cost, replaces the costliest edge of the forest path between its ends, if cheaper
+# - a removed forest edge, or a raised forest edge cost, cuts a tree in two, rejoined by the cheapest graph edge
+#   across the cut ( found by scanning the smaller side only )
+# After rebuild_threshold modifications the forest is computed again from scratch, which also catches up with any
+# change made to the graph directly
+
+class MinimumSpanningTreeMaintainer:
+
+    # CLASS INITIALIZATION
+    def __init__(self, graph: UnDirectedGraph, rebuild_threshold: int = 1000):
+        """
+        Initializes a new MinimumSpanningTreeMaintainer Object, bound to the given graph
+        :param graph: The UnDirected Graph to keep a minimum spanning forest of
+        :param rebuild_threshold: The number of modifications after which the forest is computed again from scratch
+        """
+        self.__graph = graph
+        self.__rebuild_threshold = rebuild_threshold
+        self.__tree = {}
+        self.__parent = {}
+        self.__total_cost = 0
+        self.__changes = 0
+        self.rebuild()
+
+    # CLASS MAINTAINER GETTERS
+    def edges(self):
+        """
+        Returns the edges of the minimum spanning forest, as the other engines do ( ( Vertex, Vertex, cost ) tuples )
+        """
+        return {(Vertex(target), Vertex(source), cost) for (source, adjacency) in self.__tree.items()
+                for (target, cost) in adjacency.items() if source < target}
+
+    def total_cost(self):
+        """
+        Returns the sum of the costs of the edges of the minimum spanning forest
+        """
+        return self.__total_cost
+
+    def in_tree(self, source: int, target: int):
+        """
+        Checks if the edge between the two vertices is inside the minimum spanning forest
+        :param source: Source Vertex
+        :param target: Target Vertex
+        """
+        return target in self.__tree.get(source, ())
+
+    # CLASS MAINTAINER REBUILD
+    def rebuild(self):
+        """
+        Computes the minimum spanning forest of the bound graph again from scratch
+        """
+        self.__tree = {vertex.number: {} for vertex in self.__graph.vertices()}
+        self.__parent = dict.fromkeys(self.__tree)
+        self.__total_cost = 0
+        for (source, target, cost) in minimum_spanning_tree(self.__graph):
+            self.__link(source.number, target.number, cost)
+        self.__changes = 0
+
+    def __changed(self):
+        """
+        Counts one more modification, and rebuilds the forest if there were more than rebuild_threshold of them
+        Returns True if the forest got rebuilt
+        """
+        self.__changes += 1
+        if self.__changes > self.__rebuild_threshold:
+            self.rebuild()
+            return True
+        return False
+
+    # CLASS GRAPH MODIFICATION METHODS
+    def add_vertex(self, vertex_number: int):
+        """
+        Adds a new vertex to the bound graph and returns it ( None if it is already inside the graph )
+        :param vertex_number: The ID number of the Vertex
+        """
+        vertex = self.__graph.add_vertex(vertex_number)
+        if vertex is not None:
+            self.__tree[vertex_number] = {}
+            self.__parent[vertex_number] = None
+        return vertex
+
+    def remove_vertex(self, vertex_number: int):
+        """
+        Removes a vertex and its edges from the bound graph and returns it ( None if it is not inside the graph )
+        :param vertex_number: The ID number of the Vertex
+        """
+        if not self.__graph.find_vertex(vertex_number):
+            return None
+
+        for neighbour in list(self.__graph.neighbours(vertex_number)):
+            self.remove_edge(vertex_number, neighbour)
+        self.__tree.pop(vertex_number, None)
+        self.__parent.pop(vertex_number, None)
+        return self.__graph.remove_vertex(vertex_number)
+
+    def add_edge(self, source: int, target: int, cost: int = None):
+        """
+        Adds a new Edge ( with its cost, if given ) to the bound graph and returns it ( None if it already exists )
+        :param source: Source Vertex
+        :param target: Target Vertex
+        :param cost: Optional Edge Cost
+        """
+        edge = self.__graph.add_edge(source, target)
+        if edge is None:
+            return None
+        if cost is not None:
+            self.__graph.modify_cost(source, target, cost)
+
+        for vertex in (source, target):
+            if vertex not in self.__tree:
+                self.__tree[vertex] = {}
+                self.__parent[vertex] = None
+        if not self.__changed():
+            self.__offer(source, target, cost or 0)
+        return edge
+
+    def remove_edge(self, source: int, target: int):
+        """
+        Removes an Edge from the bound graph and returns its ends ( None if it is not inside the graph )
+        :param source: Source Vertex
+        :param target: Target Vertex
+        """
+        removed = self.__graph.remove_edge(source, target)
+        if removed is None:
+            return None
+
+        if not self.__changed() and self.in_tree(source, target):
+            self.__unlink(source, target)
+            self.__reconnect(source, target)
+        return removed
+
+    def modify_cost(self, source: int, target: int, cost: int):
+        """
+        Updates the cost of an Edge of the bound graph and returns it ( None if the edge is not inside the graph )
+        :param source: Source Vertex
+        :param target: Target Vertex
+        :param cost: New Edge Cost
+        """
+        old_cost = self.__graph.get_cost(source, target) or 0
+        if self.__graph.modify_cost(source, target, cost) is None:
+            return None
+        if self.__changed():
+            return cost
+
+        new_cost = cost or 0
+        if self.in_tree(source, target):
+            # A cheaper forest edge stays in the forest, a costlier one may be replaced across its cut
+            self.__unlink(source, target)
+            if new_cost <= old_cost:
+                self.__link(source, target, new_cost)
+            else:
+                self.__reconnect(source, target)
+        elif new_cost < old_cost:
+            self.__offer(source, target, new_cost)
+        return cost
+
+    # CLASS FOREST REPAIR METHODS
+    def __link(self, source: int, target: int, cost: int):
+        """
+        Adds an edge between two different trees to the forest
+        """
+        self.__tree[source][target] = cost
+        self.__tree[target][source] = cost
+        self.__total_cost += cost
+
+        # Rerooting the tree of source at source, which then hangs from target
+        parent = self.__parent
+        previous, vertex = target, source
+        while vertex is not None:
+            parent[vertex], previous, vertex = previous, vertex, parent[vertex]
+
+    def __unlink(self, source: int, target: int):
+        """
+        Removes an edge from the forest
+        """
+        self.__total_cost -= self.__tree[source].pop(target)
+        self.__tree[target].pop(source, None)
+        if self.__parent[source] == target:
+            self.__parent[source] = None
+        else:
+            self.__parent[target] = None
+
+    def __tree_path(self, source: int, target: int):
+        """
+        Returns the list of the vertices of the forest path from source to target, None if they are in different trees
+        """
+        parent = self.__parent
+        ancestors = {}
+        vertex = source
+        while vertex is not None:
+            ancestors[vertex] = len(ancestors)
+            vertex = parent[vertex]
+
+        # Climbing from target up to the first common ancestor
+        tail = [target]
+        while tail[-1] not in ancestors:
+            if parent[tail[-1]] is None:
+                return None
+            tail.append(parent[tail[-1]])
+
+        head = list(ancestors)[:ancestors[tail[-1]]]
+        return head + tail[::-1]
+
+    def __offer(self, source: int, target: int, cost: int):
+        """
+        Puts a graph edge outside the forest into it if it joins two trees, or if it is cheaper than the costliest edge
+        of the forest path between its ends ( which then leaves the forest )
+        """
+        if source == target:
+            return
+        path = self.__tree_path(source, target)
+        if path is None:
+            self.__link(source, target, cost)
+            return
+
+        heaviest = max(range(len(path) - 1), key=lambda index: self.__tree[path[index]][path[index + 1]])
+        if cost < self.__tree[path[heaviest]][path[heaviest + 1]]:
+            self.__unlink(path[heaviest], path[heaviest + 1])
+            self.__link(source, target, cost)
+
+    def __reconnect(self, source: int, target: int):
+        """
+        Rejoins the two trees of source and target, just cut apart, with the cheapest graph edge between them ( if any )
+        """
+        # Growing both sides at the same pace, until the smaller one is complete
+        sides = ({source}, {target})
+        stacks = ([source], [target])
+        while stacks[0] and stacks[1]:
+            for (side, stack) in zip(sides, stacks):
+                vertex = stack.pop()
+                for neighbour in self.__tree[vertex]:
+                    if neighbour not in side:
+                        side.add(neighbour)
+                        stack.append(neighbour)
+        smaller = sides[0] if not stacks[0] else sides[1]
+
+        # The graph edges leaving the smaller side all lead to the other one
+        best = None
+        for vertex in smaller:
+            for neighbour in self.__graph.neighbours(vertex):
+                if neighbour not in smaller:
+                    cost = self.__graph.get_cost(vertex, neighbour) or 0
+                    if best is None or cost < best[0]:
+                        best = (cost, vertex, neighbour)
+
+        if best is not None:
+            self.__link(best[1], best[2], best[0])
@@ -0,0 +1,137 @@
+# This module contains the functionality for getting the Strongly Connected Components of a Directed Graph
+# Includes Section
+from Assignment_1.src.Domain.vertex import Vertex
+from Assignment_1.src.Domain.edge import Edge
+from Assignment_1.src.Domain.directed_graph import DirectedGraph, DirectedGraphException
+
+
+# NOTE:
+# A strongly connected component is a maximal set of vertices which can all reach each other
+# The components are found with Tarjan's algorithm, in O(V+E), with an explicit stack of outbound neighbour
+# iterators instead of recursion ( so long paths do not reach the recursion limit )
+# Every function returns the components in topological order: an edge between two different components always
+# goes from an earlier component to a later one
+
+
+# TARJAN'S ALGORITHM
+def tarjan_components(vertices, neighbours):
+    """
+    Returns the list of the strongly connected components of a directed graph, in topological order
+
+    :param vertices: Iterable of the vertices of the graph
+    :param neighbours: Function giving an iterator over the outbound neighbours of a vertex
+    """
+    index = {}
+    lowlink = {}
+    on_stack = set()
+    stack = []
+    components = []
+
+    for root in vertices:
+        if root in index:
+            continue
+
+        # Every search frame is a vertex and the iterator over its neighbours left to walk
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        frames = [(root, neighbours(root))]
+
+        while frames:
+            vertex, iterator = frames[-1]
+            for neighbour in iterator:
+                if neighbour not in index:
+                    # Going in depth for the new vertex, coming back to this iterator afterwards
+                    index[neighbour] = lowlink[neighbour] = len(index)
+                    stack.append(neighbour)
+                    on_stack.add(neighbour)
+                    frames.append((neighbour, neighbours(neighbour)))
+                    break
+                if neighbour in on_stack and index[neighbour] < lowlink[vertex]:
+                    lowlink[vertex] = index[neighbour]
+            else:
+                # All the neighbours are walked: the vertex is done
+                frames.pop()
+                if frames and lowlink[vertex] < lowlink[frames[-1][0]]:
+                    lowlink[frames[-1][0]] = lowlink[vertex]
+
+                if lowlink[vertex] == index[vertex]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == vertex:
+                            break
+                    components.append(component)
+
+    # Tarjan finds the components sinks first
+    components.reverse()
+    return components
+
+
+# STRONGLY CONNECTED COMPONENTS GETTERS
+def strongly_connected_components(graph: DirectedGraph):
+    """
+    Returns the list of all strongly connected components inside a DirectedGraph, as lists of vertex ID numbers,
+    in topological order ( the outbound adjacency of the graph is walked without copying it )
+
+    :param graph: The Directed Graph ( or Frozen Directed Graph )
+    """
+    return tarjan_components((vertex.number for vertex in graph.vertices()), graph.outbound_neighbours)
+
+
+def strongly_connected_component_ids(graph):
+    """
+    Returns the list of all strongly connected components of a Frozen Directed Graph, as lists of dense ids,
+    in topological order ( walking its CSR arrays )
+
+    :param graph: The Frozen Directed Graph
+    """
+    offsets, targets = graph.out_offsets, graph.out_targets
+
+    def neighbours(vertex):
+        return (targets[position] for position in range(offsets[vertex], offsets[vertex + 1]))
+
+    return tarjan_components(range(graph.vertices_count()), neighbours)
+
+
+def is_strongly_connected(graph: DirectedGraph):
+    """
+    Checks if every vertex of the DirectedGraph can reach every other one ( False for an empty graph )
+
+    :param graph: The Directed Graph ( or Frozen Directed Graph )
+    """
+    return graph.vertices_count() > 0 and len(strongly_connected_components(graph)) == 1
+
+
+# CONDENSATION
+def condensation(graph: DirectedGraph):
+    """
+    Returns the ( components, dag ) condensation of a DirectedGraph: the strongly connected components, in
+    topological order, and the acyclic DirectedGraph having the vertex i for components[i], with an edge i -> j if
+    some edge goes from components[i] to components[j] ( its cost being the cheapest of these edges, edges without
+    a cost counting as 0 )
+
+    :param graph: The Directed Graph ( or Frozen Directed Graph )
+    """
+    components = strongly_connected_components(graph)
+    component_of = {}
+    for (label, component) in enumerate(components):
+        for vertex in component:
+            component_of[vertex] = label
+
+    cheapest = {}
+    for (source, target, cost) in graph.weighted_edges():
+        pair = (component_of[source], component_of[target])
+        if pair[0] != pair[1]:
+            cost = cost or 0
+            if pair not in cheapest or cost < cheapest[pair]:
+                cheapest[pair] = cost
+
+    dag = DirectedGraph()
+    for label in range(len(components)):
+        dag.add_vertex(label)
+    dag.add_weighted_edges_from((source, target, cost) for ((source, target), cost) in cheapest.items())
+
+    return components, dag
@@ -61,7 +61,7 @@ class UI:
         print("4. Modify the Graph Structure")
         print("5. Connected Components via DFS ( UnDirectedGraphs Only )")
         print("6. Minimum Path between two Vertices ( DirectedGraphs Only )")
-        print("7. Minimum Spanning Tree ( Prims Algorithm - UnDirectedGraphs Only )")
+        print("7. Minimum Spanning Tree ( Prim / Kruskal - UnDirectedGraphs Only )")
         print("8. Minimum Cost Hamiltonian Cycle ( TSP - DirectedGraphs Only )")
         print("0. Exit")
 
@@ -333,9 +333,9 @@ class UI:
             target = int(input("Number ID of Target Vertex: "))
 
             UI.clear_screen()
-            walk, cost = get_minpath(self.__graph, Vertex(source), Vertex(target))
+            walk, cost, algorithm = lowest_cost_walk(self.__graph, Vertex(source), Vertex(target))
 
-            print(f"The cost of the walk was: {cost}")
+            print(f"The cost of the walk was: {cost} ( computed with {algorithm} )")
             for vertex in walk:
                 if vertex != Vertex(target):
                     print(vertex.number, end=' > ')
@@ -354,8 +354,8 @@ class UI:
         UI.clear_screen()
         try:
 
-            print("Below is the minimum spanning tree:")
-            edges = prim_minimum_spanning_tree(self.__graph)
+            print("Below is the minimum spanning tree ( of every connected component ):")
+            edges = minimum_spanning_tree(self.__graph)
 
             for edge in edges:
                 print(f"{edge[0].number} {edge[1].number} {edge[2]}")
@@ -374,10 +374,29 @@ class UI:
             print("Please enter some data to run the operation:")
             source = int(input("Number ID of Source Vertex: "))
 
+            # The exact solver is exponential, so bigger graphs get the time-budgeted heuristic solver
+            exact = self.__graph.vertices_count() <= EXACT_VERTICES
+            if not exact:
+                print(f"The graph has more than {EXACT_VERTICES} vertices, so a good cycle is searched instead")
+                seconds = input("Number of seconds to search for ( 'Enter' for 2 ): ")
+                time_limit = float(seconds) if seconds.strip() else 2.0
+
             UI.clear_screen()
-            cost, cycle = travelling_salesman_problem(self.__graph, source)
+            if exact:
+                cost, cycle = travelling_salesman_problem(self.__graph, source)
+            else:
+                cost, cycle = heuristic_travelling_salesman_problem(self.__graph, source, time_limit)
+            if cycle is None:
+                reason = hamiltonian_cycle_infeasibility(self.__graph)
+                print(reason if reason is not None else "The graph has no hamiltonian cycle")
+                print("Press 'Enter' to go back to Main Menu")
+                input()
+                return
 
-            print(f"The cost of the hamiltonian cycle was: {cost}")
+            if exact:
+                print(f"The cost of the hamiltonian cycle was: {cost}")
+            else:
+                print(f"The cost of the hamiltonian cycle found was: {cost} ( not necessarily the minimum one )")
             k = 0
             for vertex in cycle:
                 if k == 0:
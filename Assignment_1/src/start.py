@@ -18,7 +18,14 @@ def start():
 
     # OBJECT INITIALIZATION
     graph = DirectedGraph()
-    # graph = UnDirectedGraph()
+    # graph = UnDirectedGraph(track_components=True)
+
+    # GET GRAPH DATA FROM BINARY FILES
+    # Uncomment the conversion once to get the binary file, then load it instead of the text file ( read-only graph,
+    # so the small startup data read below must be commented out too )
+    # convert_graph_to_binary("../graph1m.txt", "../graph1m.bin")
+    # graph = load_graph_binary("../graph1m.bin")
+
     display = UI(graph)
 
     # GENERATE RANDOM GRAPH DATA
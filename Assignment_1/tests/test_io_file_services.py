@@ -0,0 +1,52 @@
+# This module contains the tests of the graph file operations
+# Includes Section
+import os
+import tempfile
+import unittest
+from Assignment_1.src.Domain.directed_graph import DirectedGraph, FrozenDirectedGraph
+from Assignment_1.src.Domain.undirected_graph import UnDirectedGraph, FrozenUnDirectedGraph
+from Assignment_1.src.Services.io_file_services import *
+
+
+class BinaryRoundTripTest(unittest.TestCase):
+
+    @staticmethod
+    def lines(file_path):
+        """
+        Returns the header line and the sorted edge lines of a text graph file ( the edges may be saved in any order )
+        """
+        with open(file_path) as file:
+            header, *edges = file.read().splitlines()
+        return header, sorted(edges)
+
+    def round_trip(self, graph, frozen_kind, text):
+        with tempfile.TemporaryDirectory() as directory:
+            text_path = os.path.join(directory, "graph.txt")
+            binary_path = os.path.join(directory, "graph.bin")
+            saved_path = os.path.join(directory, "saved.txt")
+            expected_path = os.path.join(directory, "expected.txt")
+            with open(text_path, 'w') as file:
+                file.write(text)
+
+            read_graph(graph, text_path)
+            save_graph_binary(graph, binary_path)
+            frozen = load_graph_binary(binary_path)
+            self.assertIsInstance(frozen, frozen_kind)
+            save_graph(frozen, saved_path)
+            save_graph(graph, expected_path)
+
+            self.assertEqual(self.lines(saved_path), self.lines(text_path))
+            with open(saved_path) as saved, open(expected_path) as expected:
+                self.assertEqual(saved.read(), expected.read())
+
+    def test_directed_round_trip(self):
+        self.round_trip(DirectedGraph(), FrozenDirectedGraph,
+                        "5 8\n1 2 3\n2 1 -1\n1 3 5\n3 4 0\n4 5 7\n5 1 2\n2 5 10\n4 2 6\n")
+
+    def test_undirected_round_trip(self):
+        self.round_trip(UnDirectedGraph(), FrozenUnDirectedGraph,
+                        "5 6\n1 2 3\n1 3 5\n2 4 -2\n3 4 0\n4 5 7\n2 5 1\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
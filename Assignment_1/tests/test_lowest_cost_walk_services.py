@@ -0,0 +1,86 @@
+# This module contains the tests of the lowest cost walk engines
+# Includes Section
+import os
+import pickle
+import tempfile
+import unittest
+from Assignment_1.src.Domain.vertex import Vertex
+from Assignment_1.src.Domain.directed_graph import DirectedGraph
+from Assignment_1.src.Services.io_file_services import save_graph_binary, load_graph_binary
+from Assignment_1.src.Services.lowest_cost_walk_services import *
+
+
+class LowestCostWalkTest(unittest.TestCase):
+
+    def test_spfa_without_negative_cycle(self):
+        # Vertex 3 is lowered V times by SPFA, without any negative cost cycle inside the graph
+        graph = DirectedGraph()
+        for vertex in range(4):
+            graph.add_vertex(vertex)
+        graph.add_weighted_edges_from([(0, 3, 1009), (0, 1, 8), (0, 2, -4), (1, 0, 211), (1, 3, 1), (2, 1, -5),
+                                       (2, 0, 13), (2, 3, -3), (3, 2, 998), (3, 1, 26)])
+
+        for algorithm in (BELLMAN_FORD, COMPONENT_BELLMAN_FORD, SPFA):
+            path, cost = get_minpath(graph, Vertex(0), Vertex(3), algorithm)
+            self.assertEqual(cost, -8)
+            self.assertEqual([vertex.number for vertex in path], [0, 2, 1, 3])
+
+    def test_spfa_negative_cycle(self):
+        graph = DirectedGraph()
+        for vertex in range(3):
+            graph.add_vertex(vertex)
+        graph.add_weighted_edges_from([(0, 1, 1), (1, 2, -3), (2, 1, 1)])
+
+        with self.assertRaises(DirectedGraphException):
+            get_minpath(graph, Vertex(0), Vertex(2), SPFA)
+
+    def test_batch_walks_on_binary_graph(self):
+        graph = DirectedGraph()
+        for vertex in range(5):
+            graph.add_vertex(vertex)
+        graph.add_weighted_edges_from([(0, 1, 4), (0, 2, 1), (2, 1, 2), (1, 3, 5), (3, 0, 1)])
+        graph.add_edge(2, 3)
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "graph.bin")
+            save_graph_binary(graph, file_path)
+            frozen = load_graph_binary(file_path)
+
+            # The worker processes get the graph pickled ( memoryviews over the file pages cannot be )
+            copy = pickle.loads(pickle.dumps(frozen))
+            self.assertEqual(sorted(copy.weighted_edges()), sorted(frozen.weighted_edges()))
+
+            pairs = [(Vertex(0), Vertex(1)), (Vertex(0), Vertex(3)), (Vertex(2), Vertex(0)), (Vertex(0), Vertex(4))]
+            walks, _ = lowest_cost_walks(frozen, pairs, workers=2)
+            self.assertEqual(walks, lowest_cost_walks(graph, pairs)[0])
+            self.assertEqual([walk and walk[1] for walk in walks], [3, 1, 1, None])
+
+    def test_cached_snapshot_follows_modifications(self):
+        graph = DirectedGraph()
+        for vertex in range(4):
+            graph.add_vertex(vertex)
+        graph.add_weighted_edges_from([(0, 1, 5), (1, 2, 5), (2, 3, 5)])
+
+        self.assertIs(graph.freeze(), graph.freeze())
+        self.assertEqual(lowest_cost_walk(graph, Vertex(0), Vertex(3))[1:], (15, DAG))
+
+        graph.add_weighted_edges_from([(0, 2, 1)])
+        self.assertEqual(lowest_cost_walk(graph, Vertex(0), Vertex(3))[1:], (6, DAG))
+
+        graph.modify_cost(0, 2, -1)
+        self.assertEqual(get_minpath(graph, Vertex(0), Vertex(3))[1], 4)
+
+        # A cycle makes the DAG engine give way
+        graph.add_edge(3, 0)
+        self.assertEqual(lowest_cost_walk(graph, Vertex(0), Vertex(3))[1:], (4, COMPONENT_BELLMAN_FORD))
+
+        graph.remove_edge(0, 2)
+        self.assertEqual(lowest_cost_walk(graph, Vertex(0), Vertex(3))[1:], (15, DIJKSTRA))
+
+        graph.remove_vertex(1)
+        with self.assertRaises(DirectedGraphException):
+            get_minpath(graph, Vertex(0), Vertex(3))
+
+
+if __name__ == "__main__":
+    unittest.main()
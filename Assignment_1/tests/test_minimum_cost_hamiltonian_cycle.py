@@ -0,0 +1,59 @@
+# This module contains the tests of the heuristic Hamiltonian cycle solver
+# Includes Section
+import random
+import unittest
+from Assignment_1.src.Domain.directed_graph import DirectedGraph
+from Assignment_1.src.Services.minimum_cost_hamiltonian_cycle import *
+
+
+class HeuristicHamiltonianCycleTest(unittest.TestCase):
+
+    @staticmethod
+    def planted_graph(n: int, out_degree: int, seed: int):
+        """
+        Returns the ( graph, costs ) of a random graph built around a hidden Hamiltonian cycle, every vertex having
+        the edge of the cycle and out_degree - 1 random other outbound edges ( fewer if some repeat )
+        """
+        shuffle = random.Random(seed)
+        graph = DirectedGraph()
+        for vertex in range(n):
+            graph.add_vertex(vertex)
+        hidden = list(range(n))
+        shuffle.shuffle(hidden)
+        costs = {(hidden[index], hidden[(index + 1) % n]): shuffle.randint(1, 1000) for index in range(n)}
+        for source in range(n):
+            for target in shuffle.sample(range(n), out_degree - 1):
+                if source != target:
+                    costs.setdefault((source, target), shuffle.randint(1, 1000))
+        graph.add_weighted_edges_from((source, target, cost) for ((source, target), cost) in costs.items())
+        return graph, costs
+
+    def assert_tour(self, graph, costs, time_limit):
+        n = graph.vertices_count()
+        for construction in (NEAREST_NEIGHBOUR, GREEDY_EDGE):
+            cost, cycle = heuristic_travelling_salesman_problem(graph, 0, time_limit, construction)
+            self.assertIsNotNone(cycle)
+            self.assertEqual(cycle[0], 0)
+            self.assertEqual(cycle[-1], 0)
+            self.assertEqual(sorted(cycle[:-1]), list(range(n)))
+            self.assertEqual(cost, sum(costs[(cycle[index], cycle[index + 1])] for index in range(n)))
+
+    def test_feasible_tour_without_time(self):
+        # The first tours walk missing edges, and the repair has to remove them all even when no time is left
+        graph, costs = self.planted_graph(300, 20, 3)
+        self.assert_tour(graph, costs, 0.0)
+
+    def test_sparse_planted_cycle(self):
+        # Out-degree 5, close to graph1k.txt: nearly every edge of a tour is forced
+        graph, costs = self.planted_graph(1000, 5, 1005)
+        self.assert_tour(graph, costs, 0.0)
+
+    def test_small_graphs_are_exact(self):
+        for seed in range(20):
+            graph, costs = self.planted_graph(7, 2, seed)
+            self.assertEqual(heuristic_travelling_salesman_problem(graph, 0, 0.0),
+                             travelling_salesman_problem(graph, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()